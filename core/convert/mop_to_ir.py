@@ -31,7 +31,7 @@ def convert_mop_dir_to_ir(mop_root: str, out_dir: str, keep_structure: bool = Tr
         if formalism not in SUPPORTED:
             continue
 
-        ir = convert_mop_file_to_ir(mop_file)
+        ir = convert_mop_text_to_ir(text, mop_file)
 
         if keep_structure:
             relative = mop_file.relative_to(mop_root)
@@ -54,7 +54,14 @@ def convert_mop_dir_to_ir(mop_root: str, out_dir: str, keep_structure: bool = Tr
 
 def convert_mop_file_to_ir(mop_path: Path) -> Dict:
     text = mop_path.read_text(encoding="utf-8", errors="replace")
+    return convert_mop_text_to_ir(text, mop_path)
 
+
+def convert_mop_text_to_ir(text: str, mop_path: Path) -> Dict:
+    """
+    Same as convert_mop_file_to_ir for callers that already read the file.
+    mop_path is only used for the spec id and the domain.
+    """
     formalism = detect_formalism(text)
     domain = detect_domain(mop_path)
 
@@ -80,6 +87,7 @@ def convert_mop_file_to_ir(mop_path: Path) -> Dict:
 _LTL_HEADER_RE = re.compile(r"(?im)^\s*(ptltl|ltl)\s*:")
 _FSM_HEADER_RE = re.compile(r"(?im)^\s*fsm\s*:")
 _ERE_HEADER_RE = re.compile(r"(?im)^\s*ere\s*:")
+_EVENT_DECL_RE = re.compile(r"(?im)^\s*event\s+")
 
 def detect_formalism(text: str) -> str:
     """
@@ -102,7 +110,7 @@ def detect_formalism(text: str) -> str:
         return "ere"
 
     # Fallback: se tem "event" mas não tem ltl/fsm/ere → é event-based
-    if re.search(r"(?im)^\s*event\s+", text):
+    if _EVENT_DECL_RE.search(text):
         return "event"
 
     return "unknown"
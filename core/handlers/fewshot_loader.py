@@ -1,10 +1,12 @@
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
+import os
 import random
 
 from nl2spec.core.handlers.random import select_random
 from nl2spec.core.handlers.mmr import select_mmr
 from nl2spec.core.handlers.mmr_irsp import select_mmr_irsp
+from nl2spec.core.handlers.irsp_matrix import IRSPFeatureMatrix
 
 from nl2spec.core.handlers.irsp.fsm_irsp import FSMFewShotSelector
 from nl2spec.core.handlers.irsp.ere_irsp import EREFewShotSelector
@@ -19,6 +21,16 @@ ALLOWED_K = {0, 1, 3}
 ALLOWED_SELECTION = {"random", "irsp", "mmr", "mmr_irsp"}
 
 
+def _iter_json_files(ir_dir: Path) -> Iterator[Path]:
+    # Hidden names are skipped and symlinked few-shots are followed;
+    # d_type spares the stat call for regular files.
+    with os.scandir(ir_dir) as it:
+        for entry in it:
+            name = entry.name
+            if name.endswith(".json") and not name.startswith(".") and entry.is_file():
+                yield Path(entry.path)
+
+
 class FewShotLoader:
     def __init__(self, fewshot_dir: str, seed: int = 42):
         self.root = Path(fewshot_dir)
@@ -30,6 +42,9 @@ class FewShotLoader:
         self.ltl_selector = LTLFewShotSelector()
         self.event_selector = EventFewShotSelector()
 
+        # ir_type -> featurized few-shot pool, rebuilt if the listing changes
+        self._mats = {}
+
         log.info("Few-shot root directory: %s", self.root)
 
     def _validate_configuration(self, shot_mode: str, k: int, selection: str):
@@ -73,11 +88,13 @@ class FewShotLoader:
         if not ir_dir.exists():
             raise FewShotNotAvailableError(str(ir_dir))
 
-        files = sorted(ir_dir.glob("*.json"))
+        files = sorted(_iter_json_files(ir_dir), key=lambda p: p.name)
         if not files:
             raise FewShotNotAvailableError(str(ir_dir))
 
         if selection == "random":
+            # Sampled from the name-sorted listing: a reservoir over raw
+            # directory order would pick different files per filesystem.
             chosen = select_random(files=files, k=k, rng=self.rng)
 
             if not return_scores:
@@ -88,23 +105,17 @@ class FewShotLoader:
 
             selector = self._get_selector(ir_type)
             return selector.score_candidates(chosen, ir_base)
-   
+
         if selection == "irsp":
             if ir_base is None:
                 raise NL2SpecException("IRSP selection requires ir_base.")
 
-            if ir_type == "fsm":
-                return self.fsm_selector.select(files, k, ir_base, return_scores)
-            if ir_type == "ere":
-                return self.ere_selector.select(files, k, ir_base, return_scores)
-            if ir_type == "ltl":
-                return self.ltl_selector.select(files, k, ir_base, return_scores)
-            if ir_type == "event":
-                return self.event_selector.select(files, k, ir_base, return_scores)
+            if ir_type not in {"fsm", "ere", "ltl", "event"}:
+                raise NL2SpecException(
+                    f"IRSP selector not implemented for ir_type '{ir_type}'."
+                )
 
-            raise NL2SpecException(
-                f"IRSP selector not implemented for ir_type '{ir_type}'."
-            )
+            return self._get_matrix(ir_type, files).select(k, ir_base, return_scores)
 
         if selection == "mmr":
             if ir_base is None:
@@ -143,6 +154,21 @@ class FewShotLoader:
         raise NL2SpecException("Unexpected selection mode.")
 
 
+    def _get_matrix(self, ir_type: str, files: List[Path]) -> IRSPFeatureMatrix:
+        mat = self._mats.get(ir_type)
+
+        if mat is None or mat.files != tuple(files):
+            log.info("Featurizing %d few-shot files for '%s'", len(files), ir_type)
+            mat = IRSPFeatureMatrix.load_or_build(
+                self._get_selector(ir_type),
+                ir_type,
+                files,
+                cache_dir=self.root / ".cache",
+            )
+            self._mats[ir_type] = mat
+
+        return mat
+
     def _get_selector(self, ir_type: str):
         if ir_type == "fsm":
             return self.fsm_selector
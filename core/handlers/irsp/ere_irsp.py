@@ -353,90 +353,87 @@ class EREFewShotSelector:
     # DISTANCE
     # ======================================================
 
-    def distance(self, v1: dict, v2: dict) -> float:
-        numeric_weights = {
-            # expression
-            "num_nodes": 1.4,
-            "num_expr_event_refs": 1.5,
-            "num_unique_expr_events": 1.8,
-            "num_concat": 1.5,
-            "num_or": 2.8,
-            "num_star": 2.7,
-            "num_plus": 2.7,
-            "num_optional": 2.0,
-            "num_not": 2.8,
-            "num_epsilon": 2.0,
-            "num_empty": 2.0,
-            "max_depth": 3.0,
-            "max_branching": 2.0,
-            "has_alternation": 1.8,
-            "has_repetition": 1.6,
-            "has_negation": 1.8,
-            "has_nested_repetition": 3.2,
-            "repetition_on_group": 2.7,
-            "is_single_event": 1.0,
-            "is_pure_sequence": 1.0,
-            "sequence_length": 1.3,
-            "starts_with_create_role": 2.2,
-            "ends_with_use_role": 2.0,
-            "ends_with_query_role": 1.8,
-            "ends_with_close_role": 1.8,
-            "expr_token_count": 1.0,
-
-            # signature
-            "num_signature_params": 1.8,
-            "has_iterator_param": 3.0,
-            "has_collection_param": 2.4,
-            "has_map_param": 2.4,
-            "has_stream_param": 2.4,
-            "has_socket_param": 2.8,
-            "has_thread_param": 2.8,
-            "has_permission_param": 2.5,
-
-            # events / pointcuts
-            "num_declared_events": 2.2,
-            "num_before_events": 1.2,
-            "num_after_events": 1.2,
-            "num_creation_events": 2.8,
-            "num_returning_events": 3.2,
-            "num_pointcut_atoms": 1.7,
-            "num_pointcut_and": 1.3,
-            "num_pointcut_or": 1.6,
-            "num_negated_pointcuts": 2.7,
-            "num_call_atoms": 1.4,
-            "num_target_atoms": 1.4,
-            "num_args_atoms": 1.6,
-            "num_cflow_atoms": 2.8,
-            "num_if_atoms": 2.0,
-            "num_condition_atoms": 2.0,
-            "num_thread_atoms": 2.2,
-            "num_negated_call": 2.0,
-            "num_negated_target": 2.2,
-            "num_negated_cflow": 3.0,
-            "num_create_role_events": 2.4,
-            "num_modify_role_events": 2.6,
-            "num_use_role_events": 2.4,
-            "num_query_role_events": 2.0,
-            "num_close_role_events": 2.4,
-            "num_config_role_events": 2.2,
-            "num_distinct_bound_vars": 1.7,
-            "pointcut_has_disjunction": 1.5,
-            "pointcut_has_conjunction": 1.3,
-            "has_iterator_usage_pattern": 2.6,
-            "has_close_after_use_pattern": 2.5,
-            "has_modify_after_use_pattern": 3.0,
-
-            # violation
-            "violation_is_match": 1.6,
-            "violation_is_fail": 1.6,
-            "violation_has_reset": 2.0,
-            "num_violation_statements": 1.0,
-        }
-
-        numeric = self.weighted_manhattan(v1, v2, numeric_weights)
+    DISTANCE_WEIGHTS = {
+        # expression
+        "num_nodes": 1.4,
+        "num_expr_event_refs": 1.5,
+        "num_unique_expr_events": 1.8,
+        "num_concat": 1.5,
+        "num_or": 2.8,
+        "num_star": 2.7,
+        "num_plus": 2.7,
+        "num_optional": 2.0,
+        "num_not": 2.8,
+        "num_epsilon": 2.0,
+        "num_empty": 2.0,
+        "max_depth": 3.0,
+        "max_branching": 2.0,
+        "has_alternation": 1.8,
+        "has_repetition": 1.6,
+        "has_negation": 1.8,
+        "has_nested_repetition": 3.2,
+        "repetition_on_group": 2.7,
+        "is_single_event": 1.0,
+        "is_pure_sequence": 1.0,
+        "sequence_length": 1.3,
+        "starts_with_create_role": 2.2,
+        "ends_with_use_role": 2.0,
+        "ends_with_query_role": 1.8,
+        "ends_with_close_role": 1.8,
+        "expr_token_count": 1.0,
+
+        # signature
+        "num_signature_params": 1.8,
+        "has_iterator_param": 3.0,
+        "has_collection_param": 2.4,
+        "has_map_param": 2.4,
+        "has_stream_param": 2.4,
+        "has_socket_param": 2.8,
+        "has_thread_param": 2.8,
+        "has_permission_param": 2.5,
+
+        # events / pointcuts
+        "num_declared_events": 2.2,
+        "num_before_events": 1.2,
+        "num_after_events": 1.2,
+        "num_creation_events": 2.8,
+        "num_returning_events": 3.2,
+        "num_pointcut_atoms": 1.7,
+        "num_pointcut_and": 1.3,
+        "num_pointcut_or": 1.6,
+        "num_negated_pointcuts": 2.7,
+        "num_call_atoms": 1.4,
+        "num_target_atoms": 1.4,
+        "num_args_atoms": 1.6,
+        "num_cflow_atoms": 2.8,
+        "num_if_atoms": 2.0,
+        "num_condition_atoms": 2.0,
+        "num_thread_atoms": 2.2,
+        "num_negated_call": 2.0,
+        "num_negated_target": 2.2,
+        "num_negated_cflow": 3.0,
+        "num_create_role_events": 2.4,
+        "num_modify_role_events": 2.6,
+        "num_use_role_events": 2.4,
+        "num_query_role_events": 2.0,
+        "num_close_role_events": 2.4,
+        "num_config_role_events": 2.2,
+        "num_distinct_bound_vars": 1.7,
+        "pointcut_has_disjunction": 1.5,
+        "pointcut_has_conjunction": 1.3,
+        "has_iterator_usage_pattern": 2.6,
+        "has_close_after_use_pattern": 2.5,
+        "has_modify_after_use_pattern": 3.0,
+
+        # violation
+        "violation_is_match": 1.6,
+        "violation_is_fail": 1.6,
+        "violation_has_reset": 2.0,
+        "num_violation_statements": 1.0,
+    }
 
-        
-        return numeric 
+    def distance(self, v1: dict, v2: dict) -> float:
+        return self.weighted_manhattan(v1, v2, self.DISTANCE_WEIGHTS)
 
     def weighted_manhattan(self, v1: dict, v2: dict, weights: dict) -> float:
         distance = 0.0
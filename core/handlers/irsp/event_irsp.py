@@ -539,24 +539,23 @@ class EventFewShotSelector:
     # DISTANCE
     # ======================================================
 
-    def distance(self, v1: dict, v2: dict) -> float:
-        weights = {
-            # signature
-            "num_signature_params": 2.0,
-            "has_iterator_param": 2.5,
-            "has_collection_param": 2.0,
-            "has_map_param": 2.0,
-            "has_stream_param": 2.0,
-            "has_socket_param": 2.2,
-            "has_thread_param": 2.2,
-            "has_permission_param": 2.2,
-            "has_array_param": 1.8,
-            "has_int_param": 2.8,
-            "has_string_param": 1.8,
-            "has_object_param": 1.4,
-            
-            "tok_mark": 3.2,
-            "tok_reset": 3.2,
+    DISTANCE_WEIGHTS = {
+        # signature
+        "num_signature_params": 2.0,
+        "has_iterator_param": 2.5,
+        "has_collection_param": 2.0,
+        "has_map_param": 2.0,
+        "has_stream_param": 2.0,
+        "has_socket_param": 2.2,
+        "has_thread_param": 2.2,
+        "has_permission_param": 2.2,
+        "has_array_param": 1.8,
+        "has_int_param": 2.8,
+        "has_string_param": 1.8,
+        "has_object_param": 1.4,
+        
+        "tok_mark": 3.2,
+        "tok_reset": 3.2,
 "tok_readaheadlimit": 3.0,
 
 "call_tok_mark": 4.0,
@@ -570,180 +569,181 @@ class EventFewShotSelector:
 
 "pattern_mark_reset": 5.0,
 
-            # events / pointcuts
-            "num_declared_events": 3.0,
-            "num_before_events": 1.4,
-            "num_after_events": 2.8,
-            "num_returning_events": 4.8,
-            "has_mixed_timing": 4.2,
-            "num_pointcut_atoms": 2.0,
-            "num_pointcut_and": 1.4,
-            "num_pointcut_or": 1.8,
-            "num_call_atoms": 1.6,
-            "num_target_atoms": 1.6,
-            "num_args_atoms": 1.5,
-            "num_condition_atoms": 2.6,
-            "num_if_atoms": 2.4,
-            "has_constructor_call": 2.0,
-            "has_staticinitialization_call": 3.2,
-            "has_void_call": 1.5,
-            "has_primitive_return_call": 3.8,
-            "has_wildcard_call": 1.0,
-            "pointcut_has_disjunction": 1.8,
-            "pointcut_has_conjunction": 1.0,
-            "is_single_event": 1.0,
-            "is_multi_event": 1.8,
-
-            # roles
-            "num_read_role_events": 2.0,
-            "num_write_role_events": 2.0,
-            "num_close_role_events": 3.6,
-            "num_modify_role_events": 2.2,
-            "num_compare_role_events": 2.2,
-            "num_copy_role_events": 2.2,
-            "num_permission_role_events": 2.0,
-            "num_timeout_role_events": 2.0,
-            "num_create_role_events": 2.2,
-
-            # violation
-            "violation_is_fail": 1.6,
-            "violation_is_match": 1.6,
-            "violation_has_reset": 2.2,
-            "num_violation_statements": 1.2,
-            "has_log_violation": 1.8,
-            "has_raw_violation": 1.2,
-            "has_default_message_only": 1.0,
-            "has_local_violation": 3.2,
-            "has_global_violation": 0.8,
-            "num_local_violation_methods": 2.6,
-            "num_global_violation_statements": 0.6,
-            "num_local_violation_statements": 1.4,
-
-            # generic token indicators
-            "tok_read": 1.8,
-            "tok_write": 2.0,
-            "tok_close": 2.8,
-            "tok_flush": 2.0,
-            "tok_put": 2.0,
-            "tok_add": 2.0,
-            "tok_remove": 2.0,
-            "tok_compare": 2.0,
-            "tok_copy": 2.8,
-            "tok_decode": 3.2,
-            "tok_encode": 2.0,
-            "tok_timeout": 2.0,
-            "tok_permission": 2.0,
-            "tok_constructor": 2.2,
-            "tok_staticinit": 2.4,
-            "tok_null": 1.8,
-            "tok_hashcode": 1.8,
-            "tok_clone": 1.8,
-            "tok_serializable": 1.8,
-            "tok_factory": 1.8,
-            "tok_enum": 1.8,
-
-            # call token features
-            "call_tok_map": 2.0,
-            "call_tok_set": 1.6,
-            "call_tok_list": 4.4,
-            "call_tok_collection": 1.8,
-            "call_tok_queue": 1.8,
-            "call_tok_stream": 2.0,
-            "call_tok_reader": 1.2,
-            "call_tok_writer": 2.0,
-            "call_tok_socket": 2.2,
-            "call_tok_url": 2.0,
-            "call_tok_system": 3.0,
-            "call_tok_arrays": 2.0,
-            "call_tok_enum": 2.0,
-            "call_tok_thread": 2.0,
-            "call_tok_permission": 2.2,
-            "call_tok_classloader": 2.2,
-            "call_tok_constructor": 2.4,
-            "call_tok_staticinit": 2.6,
-            "call_tok_compare": 2.2,
-            "call_tok_hashcode": 2.0,
-            "call_tok_clone": 2.0,
-            "call_tok_timeout": 2.2,
-            "call_tok_read": 2.2,
-            "call_tok_write": 1.8,
-            "call_tok_close": 3.0,
-            "call_tok_flush": 1.8,
-            "call_tok_add": 3.0,
-            "call_tok_put": 1.8,
-            "call_tok_remove": 1.8,
-            "call_tok_get": 3.0,
-            "call_tok_decode": 4.2,
-            "call_tok_encode": 2.2,
-            "call_tok_copy": 3.0,
-            "call_tok_range_api": 1.6,
-
-            # condition token features
-            "cond_tok_null": 3.8,
-            "cond_tok_minus_one": 3.8,
-            "cond_tok_zero": 1.2,
-            "cond_tok_range": 2.2,
-            "cond_tok_self": 2.4,
-            "cond_tok_same_ref": 2.0,
-            "cond_tok_neq": 1.8,
-            "cond_tok_gt": 2.2,
-            "cond_tok_lt": 2.2,
-            "cond_tok_ge": 2.4,
-            "cond_tok_le": 2.4,
-            "cond_tok_comparable": 2.2,
-            "cond_tok_permission": 2.2,
-            "cond_tok_timeout": 2.2,
-            "cond_tok_serializable": 2.0,
-            "cond_tok_clone": 2.0,
-            "cond_tok_hashcode": 2.0,
-            "cond_tok_constructor": 2.0,
-            "cond_tok_type": 1.8,
-            "cond_tok_empty": 2.2,
-
-            # message token features
-            "msg_tok_null": 3.0,
-            "msg_tok_close": 3.4,
-            "msg_tok_timeout": 2.0,
-            "msg_tok_permission": 2.2,
-            "msg_tok_constructor": 2.2,
-            "msg_tok_comparable": 2.2,
-            "msg_tok_hashcode": 2.0,
-            "msg_tok_clone": 2.0,
-            "msg_tok_serializable": 2.0,
-            "msg_tok_range": 1.8,
-            "msg_tok_self": 2.0,
-            "msg_tok_read": 1.6,
-            "msg_tok_write": 1.6,
-            "msg_tok_flush": 1.6,
-            "msg_tok_put": 1.6,
-            "msg_tok_add": 1.6,
-            "msg_tok_remove": 1.6,
-            "msg_tok_copy": 1.8,
-            "msg_tok_decode": 2.8,
-            "msg_tok_encode": 1.8,
-            "msg_tok_factory": 1.8,
-            "msg_tok_enum": 1.8,
-            "msg_tok_socket": 1.8,
-            "msg_tok_stream": 1.8,
-
-            # pattern features
-            "pattern_null_argument": 3.6,
-            "pattern_self_reference": 2.8,
-            "pattern_constructor_validation": 2.0,
-            "pattern_static_factory": 3.0,
-            "pattern_staticinit": 2.8,
-            "pattern_timeout_validation": 2.5,
-            "pattern_permission_validation": 2.6,
-            "pattern_comparable_validation": 2.6,
-            "pattern_range_validation": 1.6,
-            "pattern_serialization_validation": 2.4,
-            "pattern_clone_validation": 2.2,
-            "pattern_hashcode_validation": 2.2,
-            "pattern_close_misuse": 4.2,
-            "pattern_encoding_validation": 3.4,
-        }
+        # events / pointcuts
+        "num_declared_events": 3.0,
+        "num_before_events": 1.4,
+        "num_after_events": 2.8,
+        "num_returning_events": 4.8,
+        "has_mixed_timing": 4.2,
+        "num_pointcut_atoms": 2.0,
+        "num_pointcut_and": 1.4,
+        "num_pointcut_or": 1.8,
+        "num_call_atoms": 1.6,
+        "num_target_atoms": 1.6,
+        "num_args_atoms": 1.5,
+        "num_condition_atoms": 2.6,
+        "num_if_atoms": 2.4,
+        "has_constructor_call": 2.0,
+        "has_staticinitialization_call": 3.2,
+        "has_void_call": 1.5,
+        "has_primitive_return_call": 3.8,
+        "has_wildcard_call": 1.0,
+        "pointcut_has_disjunction": 1.8,
+        "pointcut_has_conjunction": 1.0,
+        "is_single_event": 1.0,
+        "is_multi_event": 1.8,
+
+        # roles
+        "num_read_role_events": 2.0,
+        "num_write_role_events": 2.0,
+        "num_close_role_events": 3.6,
+        "num_modify_role_events": 2.2,
+        "num_compare_role_events": 2.2,
+        "num_copy_role_events": 2.2,
+        "num_permission_role_events": 2.0,
+        "num_timeout_role_events": 2.0,
+        "num_create_role_events": 2.2,
+
+        # violation
+        "violation_is_fail": 1.6,
+        "violation_is_match": 1.6,
+        "violation_has_reset": 2.2,
+        "num_violation_statements": 1.2,
+        "has_log_violation": 1.8,
+        "has_raw_violation": 1.2,
+        "has_default_message_only": 1.0,
+        "has_local_violation": 3.2,
+        "has_global_violation": 0.8,
+        "num_local_violation_methods": 2.6,
+        "num_global_violation_statements": 0.6,
+        "num_local_violation_statements": 1.4,
+
+        # generic token indicators
+        "tok_read": 1.8,
+        "tok_write": 2.0,
+        "tok_close": 2.8,
+        "tok_flush": 2.0,
+        "tok_put": 2.0,
+        "tok_add": 2.0,
+        "tok_remove": 2.0,
+        "tok_compare": 2.0,
+        "tok_copy": 2.8,
+        "tok_decode": 3.2,
+        "tok_encode": 2.0,
+        "tok_timeout": 2.0,
+        "tok_permission": 2.0,
+        "tok_constructor": 2.2,
+        "tok_staticinit": 2.4,
+        "tok_null": 1.8,
+        "tok_hashcode": 1.8,
+        "tok_clone": 1.8,
+        "tok_serializable": 1.8,
+        "tok_factory": 1.8,
+        "tok_enum": 1.8,
+
+        # call token features
+        "call_tok_map": 2.0,
+        "call_tok_set": 1.6,
+        "call_tok_list": 4.4,
+        "call_tok_collection": 1.8,
+        "call_tok_queue": 1.8,
+        "call_tok_stream": 2.0,
+        "call_tok_reader": 1.2,
+        "call_tok_writer": 2.0,
+        "call_tok_socket": 2.2,
+        "call_tok_url": 2.0,
+        "call_tok_system": 3.0,
+        "call_tok_arrays": 2.0,
+        "call_tok_enum": 2.0,
+        "call_tok_thread": 2.0,
+        "call_tok_permission": 2.2,
+        "call_tok_classloader": 2.2,
+        "call_tok_constructor": 2.4,
+        "call_tok_staticinit": 2.6,
+        "call_tok_compare": 2.2,
+        "call_tok_hashcode": 2.0,
+        "call_tok_clone": 2.0,
+        "call_tok_timeout": 2.2,
+        "call_tok_read": 2.2,
+        "call_tok_write": 1.8,
+        "call_tok_close": 3.0,
+        "call_tok_flush": 1.8,
+        "call_tok_add": 3.0,
+        "call_tok_put": 1.8,
+        "call_tok_remove": 1.8,
+        "call_tok_get": 3.0,
+        "call_tok_decode": 4.2,
+        "call_tok_encode": 2.2,
+        "call_tok_copy": 3.0,
+        "call_tok_range_api": 1.6,
+
+        # condition token features
+        "cond_tok_null": 3.8,
+        "cond_tok_minus_one": 3.8,
+        "cond_tok_zero": 1.2,
+        "cond_tok_range": 2.2,
+        "cond_tok_self": 2.4,
+        "cond_tok_same_ref": 2.0,
+        "cond_tok_neq": 1.8,
+        "cond_tok_gt": 2.2,
+        "cond_tok_lt": 2.2,
+        "cond_tok_ge": 2.4,
+        "cond_tok_le": 2.4,
+        "cond_tok_comparable": 2.2,
+        "cond_tok_permission": 2.2,
+        "cond_tok_timeout": 2.2,
+        "cond_tok_serializable": 2.0,
+        "cond_tok_clone": 2.0,
+        "cond_tok_hashcode": 2.0,
+        "cond_tok_constructor": 2.0,
+        "cond_tok_type": 1.8,
+        "cond_tok_empty": 2.2,
+
+        # message token features
+        "msg_tok_null": 3.0,
+        "msg_tok_close": 3.4,
+        "msg_tok_timeout": 2.0,
+        "msg_tok_permission": 2.2,
+        "msg_tok_constructor": 2.2,
+        "msg_tok_comparable": 2.2,
+        "msg_tok_hashcode": 2.0,
+        "msg_tok_clone": 2.0,
+        "msg_tok_serializable": 2.0,
+        "msg_tok_range": 1.8,
+        "msg_tok_self": 2.0,
+        "msg_tok_read": 1.6,
+        "msg_tok_write": 1.6,
+        "msg_tok_flush": 1.6,
+        "msg_tok_put": 1.6,
+        "msg_tok_add": 1.6,
+        "msg_tok_remove": 1.6,
+        "msg_tok_copy": 1.8,
+        "msg_tok_decode": 2.8,
+        "msg_tok_encode": 1.8,
+        "msg_tok_factory": 1.8,
+        "msg_tok_enum": 1.8,
+        "msg_tok_socket": 1.8,
+        "msg_tok_stream": 1.8,
+
+        # pattern features
+        "pattern_null_argument": 3.6,
+        "pattern_self_reference": 2.8,
+        "pattern_constructor_validation": 2.0,
+        "pattern_static_factory": 3.0,
+        "pattern_staticinit": 2.8,
+        "pattern_timeout_validation": 2.5,
+        "pattern_permission_validation": 2.6,
+        "pattern_comparable_validation": 2.6,
+        "pattern_range_validation": 1.6,
+        "pattern_serialization_validation": 2.4,
+        "pattern_clone_validation": 2.2,
+        "pattern_hashcode_validation": 2.2,
+        "pattern_close_misuse": 4.2,
+        "pattern_encoding_validation": 3.4,
+    }
 
-        return self.weighted_manhattan(v1, v2, weights)
+    def distance(self, v1: dict, v2: dict) -> float:
+        return self.weighted_manhattan(v1, v2, self.DISTANCE_WEIGHTS)
 
     def weighted_manhattan(self, v1: dict, v2: dict, weights: dict) -> float:
         distance = 0.0
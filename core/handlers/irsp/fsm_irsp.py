@@ -520,103 +520,104 @@ class FSMFewShotSelector:
     # DISTANCE
     # ======================================================
 
+    DISTANCE_WEIGHTS = {
+        # topology
+        "num_states": 2.0,
+        "num_transitions": 2.0,
+        "num_final_states": 1.5,
+        "num_intermediate_states": 1.5,
+        "num_error_states": 2.0,
+        "max_out_degree": 1.5,
+        "max_in_degree": 1.0,
+        "avg_out_degree": 1.5,
+        "max_depth": 3.0,
+        "num_sink_states": 3.0,
+        "num_self_loops": 3.5,
+        "has_cycle": 2.0,
+        "num_paths_to_error": 2.5,
+        "error_out_degree": 2.5,
+        "error_is_terminal": 2.0,
+
+        # violation / pointcut
+        "violation_is_fail": 1.5,
+        "violation_is_violation": 1.0,
+        "has_creation_event": 2.5,
+        "has_boolean_returning": 3.5,
+        "has_condition_in_pointcut": 3.5,
+        "has_target_in_pointcut": 2.0,
+        "has_call_in_pointcut": 1.5,
+        "has_args_in_pointcut": 1.5,
+
+        # topology-style patterns
+        "has_branching": 1.5,
+        "is_linear_chain": 1.5,
+        "pattern_precedence_like": 1.5,
+        "pattern_response_like": 1.5,
+
+        # semantic features
+        "has_open": 5.0,
+        "has_close": 6.0,
+        "has_connect": 7.0,
+        "has_disconnect": 6.0,
+        "has_shutdown": 7.0,
+        "has_register": 7.0,
+        "has_unregister": 5.0,
+        "has_start": 6.0,
+        "has_interrupt": 7.0,
+        "has_exit": 7.0,
+        "has_awt": 8.0,
+        "has_swing": 8.0,
+        "has_read": 5.0,
+        "has_write": 5.0,
+        "has_flush": 6.0,
+        "has_search": 6.0,
+        "has_binary": 6.0,
+        "has_sort": 6.0,
+        "has_modify": 5.0,
+        "has_timeout": 7.0,
+        "has_enter": 5.0,
+        "has_leave": 5.0,
+        "has_input": 5.0,
+        "has_output": 5.0,
+        "has_iterator": 6.0,
+        "has_listiterator": 7.0,
+        "has_next": 5.0,
+        "has_previous": 6.0,
+        "has_hasnext": 6.0,
+        "has_hasprevious": 7.0,
+        "has_more": 5.0,
+        "has_elements": 5.0,
+        "has_tokenizer": 7.0,
+        "has_word": 6.0,
+        "has_num": 6.0,
+        "has_sval": 7.0,
+        "has_nval": 7.0,
+        "has_field_access": 7.0,
+        "is_stream": 5.0,
+        "is_socket": 7.0,
+        "is_file": 6.0,
+        "is_reader": 5.0,
+        "is_writer": 5.0,
+        "is_piped": 8.0,
+
+        # composite semantic patterns
+        "pattern_resource_lifecycle": 7.0,
+        "pattern_connect_use_close": 8.0,
+        "pattern_iterator_guard": 8.0,
+        "pattern_bidirectional_iterator": 9.0,
+        "pattern_tokenizer_guard": 8.0,
+        "pattern_timeout_socket": 9.0,
+        "pattern_sort_then_search": 9.0,
+        "pattern_sort_modify_search": 10.0,
+        "pattern_piped_unconnected_io": 10.0,
+        "pattern_shutdown_hook": 10.0,
+        "pattern_ui_unsafe_shutdown": 10.0,
+        "pattern_streamtokenizer_field_access": 10.0,
+        "pattern_flush_before_retrieve": 9.0,
+    }
+
     def distance(self, v1: dict, v2: dict) -> float:
-        weights = {
-            # topology
-            "num_states": 2.0,
-            "num_transitions": 2.0,
-            "num_final_states": 1.5,
-            "num_intermediate_states": 1.5,
-            "num_error_states": 2.0,
-            "max_out_degree": 1.5,
-            "max_in_degree": 1.0,
-            "avg_out_degree": 1.5,
-            "max_depth": 3.0,
-            "num_sink_states": 3.0,
-            "num_self_loops": 3.5,
-            "has_cycle": 2.0,
-            "num_paths_to_error": 2.5,
-            "error_out_degree": 2.5,
-            "error_is_terminal": 2.0,
-
-            # violation / pointcut
-            "violation_is_fail": 1.5,
-            "violation_is_violation": 1.0,
-            "has_creation_event": 2.5,
-            "has_boolean_returning": 3.5,
-            "has_condition_in_pointcut": 3.5,
-            "has_target_in_pointcut": 2.0,
-            "has_call_in_pointcut": 1.5,
-            "has_args_in_pointcut": 1.5,
-
-            # topology-style patterns
-            "has_branching": 1.5,
-            "is_linear_chain": 1.5,
-            "pattern_precedence_like": 1.5,
-            "pattern_response_like": 1.5,
-
-            # semantic features
-            "has_open": 5.0,
-            "has_close": 6.0,
-            "has_connect": 7.0,
-            "has_disconnect": 6.0,
-            "has_shutdown": 7.0,
-            "has_register": 7.0,
-            "has_unregister": 5.0,
-            "has_start": 6.0,
-            "has_interrupt": 7.0,
-            "has_exit": 7.0,
-            "has_awt": 8.0,
-            "has_swing": 8.0,
-            "has_read": 5.0,
-            "has_write": 5.0,
-            "has_flush": 6.0,
-            "has_search": 6.0,
-            "has_binary": 6.0,
-            "has_sort": 6.0,
-            "has_modify": 5.0,
-            "has_timeout": 7.0,
-            "has_enter": 5.0,
-            "has_leave": 5.0,
-            "has_input": 5.0,
-            "has_output": 5.0,
-            "has_iterator": 6.0,
-            "has_listiterator": 7.0,
-            "has_next": 5.0,
-            "has_previous": 6.0,
-            "has_hasnext": 6.0,
-            "has_hasprevious": 7.0,
-            "has_more": 5.0,
-            "has_elements": 5.0,
-            "has_tokenizer": 7.0,
-            "has_word": 6.0,
-            "has_num": 6.0,
-            "has_sval": 7.0,
-            "has_nval": 7.0,
-            "has_field_access": 7.0,
-            "is_stream": 5.0,
-            "is_socket": 7.0,
-            "is_file": 6.0,
-            "is_reader": 5.0,
-            "is_writer": 5.0,
-            "is_piped": 8.0,
-
-            # composite semantic patterns
-            "pattern_resource_lifecycle": 7.0,
-            "pattern_connect_use_close": 8.0,
-            "pattern_iterator_guard": 8.0,
-            "pattern_bidirectional_iterator": 9.0,
-            "pattern_tokenizer_guard": 8.0,
-            "pattern_timeout_socket": 9.0,
-            "pattern_sort_then_search": 9.0,
-            "pattern_sort_modify_search": 10.0,
-            "pattern_piped_unconnected_io": 10.0,
-            "pattern_shutdown_hook": 10.0,
-            "pattern_ui_unsafe_shutdown": 10.0,
-            "pattern_streamtokenizer_field_access": 10.0,
-            "pattern_flush_before_retrieve": 9.0,
-        }
-        return self.weighted_manhattan(v1, v2, weights)
+        return self.weighted_manhattan(v1, v2, self.DISTANCE_WEIGHTS)
 
     def weighted_manhattan(self, v1: dict, v2: dict, weights: dict) -> float:
         distance = 0.0
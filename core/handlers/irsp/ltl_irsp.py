@@ -89,30 +89,30 @@ class LTLFewShotSelector:
 
         return vector
 
+    DISTANCE_WEIGHTS = {
+        "is_password": 12,
+        "is_file": 10,
+        "is_iterator": 10,
+        "is_socket": 8,
+
+        "action_close": 6,
+        "action_init": 8,
+        "action_delete": 10,
+        "action_deleteonexit": 10,
+        "action_fill": 12,
+        "action_next": 10,
+        "action_hasnext": 10,
+        "action_hasmore": 10,
+
+        "pattern_delete_or": 15,
+        "pattern_init": 12,
+        "pattern_tokenizer": 12,
+
+        "uses_or": 6,
+    }
+
     def distance(self, v1, v2):
-        weights = {
-            "is_password": 12,
-            "is_file": 10,
-            "is_iterator": 10,
-            "is_socket": 8,
-
-            "action_close": 6,
-            "action_init": 8,
-            "action_delete": 10,
-            "action_deleteonexit": 10,
-            "action_fill": 12,
-            "action_next": 10,
-            "action_hasnext": 10,
-            "action_hasmore": 10,
-
-            "pattern_delete_or": 15,
-            "pattern_init": 12,
-            "pattern_tokenizer": 12,
-
-            "uses_or": 6,
-        }
-
-        return self._weighted_manhattan(v1, v2, weights)
+        return self._weighted_manhattan(v1, v2, self.DISTANCE_WEIGHTS)
 
     def _split_tokens(self, text: str):
         if not text:
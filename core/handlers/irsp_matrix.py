@@ -0,0 +1,174 @@
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+import inspect
+import json
+
+import numpy as np
+
+from nl2spec.logging_utils import get_logger
+
+log = get_logger(__name__)
+
+
+class IRSPFeatureMatrix:
+    """
+    Few-shot pool of one formalism featurized once into a (n_fewshots, d)
+    matrix, d being the keys of the selector's DISTANCE_WEIGHTS.
+
+    Ranking is a single weighted-Manhattan pass over the matrix. Candidates
+    up to the k-th distance are then re-scored with selector.distance(), so
+    scores and (distance, name) tie-breaking match selector.select().
+    """
+
+    # Slack between the vectorized and the per-key Python sums.
+    _TOLERANCE = 1e-9
+
+    def __init__(self, selector, files: Sequence[Path], paths: List[Path], matrix: np.ndarray):
+        self.selector = selector
+        self.files = tuple(files)
+        self.keys = list(selector.DISTANCE_WEIGHTS)
+        self.weights = np.array(
+            [selector.DISTANCE_WEIGHTS[key] for key in self.keys],
+            dtype=np.float64,
+        )
+        self.paths = paths
+        self.matrix = matrix
+
+    @classmethod
+    def build(cls, selector, formalism: str, files: Sequence[Path]) -> "IRSPFeatureMatrix":
+        keys = list(selector.DISTANCE_WEIGHTS)
+        paths: List[Path] = []
+        rows = []
+
+        for path in files:
+            with open(path, "r", encoding="utf-8") as f:
+                template_json = json.load(f)
+
+            template_formalism = (template_json.get("formalism", "") or "").lower()
+            if template_formalism != formalism:
+                continue
+
+            vector = selector.extract_vector(template_json)
+            paths.append(path)
+            rows.append([vector.get(key, 0) for key in keys])
+
+        matrix = np.array(rows, dtype=np.float64).reshape(len(rows), len(keys))
+        return cls(selector, files, paths, matrix)
+
+    # ======================================================
+    # ON-DISK CACHE
+    # ======================================================
+
+    @classmethod
+    def load_or_build(
+        cls,
+        selector,
+        formalism: str,
+        files: Sequence[Path],
+        cache_dir: Path,
+    ) -> "IRSPFeatureMatrix":
+        """
+        Reuse <cache_dir>/irsp_<formalism>.npy (memory-mapped) when it was
+        written for the same file listing and feature keys, and is newer
+        than every few-shot file and the selector's source. Otherwise
+        featurize and rewrite the cache.
+        """
+        npy_path = cache_dir / f"irsp_{formalism}.npy"
+        meta_path = cache_dir / f"irsp_{formalism}.json"
+
+        try:
+            cached = cls._load_cache(selector, files, npy_path, meta_path)
+        except (ValueError, KeyError, TypeError, OSError) as e:
+            # truncated/corrupt cache or stale names: rebuild it
+            log.warning("Ignoring unreadable feature cache %s: %s", npy_path, e)
+            cached = None
+
+        if cached is not None:
+            log.info("Loaded %s features from cache: %s", formalism, npy_path)
+            return cached
+
+        mat = cls.build(selector, formalism, files)
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            np.save(npy_path, mat.matrix)
+            meta_path.write_text(
+                json.dumps({
+                    "keys": mat.keys,
+                    "files": [p.name for p in mat.files],
+                    "paths": [p.name for p in mat.paths],
+                }),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            log.warning("Could not write feature cache %s: %s", npy_path, e)
+
+        return mat
+
+    @classmethod
+    def _load_cache(
+        cls,
+        selector,
+        files: Sequence[Path],
+        npy_path: Path,
+        meta_path: Path,
+    ) -> Optional["IRSPFeatureMatrix"]:
+        if not npy_path.exists() or not meta_path.exists():
+            return None
+
+        cache_mtime = min(npy_path.stat().st_mtime, meta_path.stat().st_mtime)
+        sources = [Path(inspect.getfile(type(selector)))] + list(files)
+        if any(p.stat().st_mtime > cache_mtime for p in sources):
+            return None
+
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        if not isinstance(meta, dict):
+            return None
+        if meta.get("keys") != list(selector.DISTANCE_WEIGHTS):
+            return None
+        if meta.get("files") != [p.name for p in files]:
+            return None
+
+        by_name = {p.name: p for p in files}
+        paths = [by_name[name] for name in meta.get("paths", [])]
+
+        matrix = np.load(npy_path, mmap_mode="r")
+        if matrix.shape != (len(paths), len(meta["keys"])):
+            return None
+
+        return cls(selector, files, paths, matrix)
+
+    # ======================================================
+    # SELECTION
+    # ======================================================
+
+    def select(self, k: int, ir_base: dict, return_scores: bool = False):
+        n = len(self.paths)
+        if n == 0:
+            return []
+
+        base_vector = self.selector.extract_vector(ir_base)
+        query = np.array([base_vector.get(key, 0) for key in self.keys], dtype=np.float64)
+
+        dists = np.abs(self.matrix - query) @ self.weights
+
+        if k < n:
+            kth = np.partition(dists, k - 1)[k - 1]
+            candidates = np.flatnonzero(dists <= kth + self._TOLERANCE)
+        else:
+            candidates = range(n)
+
+        scored: List[Tuple[Path, float]] = [
+            (self.paths[i], float(self.selector.distance(self._row_vector(i), base_vector)))
+            for i in candidates
+        ]
+        scored.sort(key=lambda x: (x[1], x[0].name))
+        top = scored[:k]
+
+        if return_scores:
+            return top
+
+        return [path for path, _ in top]
+
+    def _row_vector(self, i: int) -> dict:
+        return dict(zip(self.keys, self.matrix[i].tolist()))
@@ -1,8 +1,14 @@
 import json
 from jsonschema import Draft202012Validator
+from functools import lru_cache
 from pathlib import Path
 from operator import attrgetter
 
+try:
+    import fastjsonschema
+except ImportError:  # optional: jsonschema alone is used as fallback
+    fastjsonschema = None
+
 
 class IRValidationResult:
     def __init__(self, valid: bool, errors=None):
@@ -13,6 +19,47 @@ class IRValidationResult:
         return self.valid
 
 
+# fastjsonschema has no 2020-12 generator. Its 2019-09 one is pinned
+# explicitly and only used when the schema avoids the keywords whose
+# meaning differs between the two drafts.
+_FAST_DRAFT = "https://json-schema.org/draft/2019-09/schema"
+_DRAFT_2020_ONLY = frozenset({"prefixItems", "$dynamicRef", "$dynamicAnchor"})
+
+
+def _fast_compatible(node) -> bool:
+    if isinstance(node, list):
+        return all(_fast_compatible(n) for n in node)
+    if not isinstance(node, dict):
+        return True
+    if _DRAFT_2020_ONLY & node.keys() or isinstance(node.get("items"), list):
+        return False
+    return all(_fast_compatible(n) for n in node.values())
+
+
+@lru_cache(maxsize=None)
+def _compile_schema(schema_path: str, mtime_ns: int):
+    """
+    Load and compile a schema once per (path, mtime); generate_one builds an
+    IRValidator per IR, so compiling in __init__ would run on every call.
+    """
+    with open(schema_path, "r", encoding="utf-8") as f:
+        schema = json.load(f)
+
+    validator = Draft202012Validator(schema)
+
+    fast_validate = None
+    if fastjsonschema is not None and _fast_compatible(schema):
+        try:
+            fast_validate = fastjsonschema.compile(
+                {**schema, "$schema": _FAST_DRAFT},
+                use_default=False,
+            )
+        except fastjsonschema.JsonSchemaDefinitionException:
+            fast_validate = None
+
+    return schema, validator, fast_validate
+
+
 class IRValidator:
     def __init__(self, schema_path: str):
         self.schema_path = Path(schema_path)
@@ -20,15 +67,24 @@ class IRValidator:
         if not self.schema_path.exists():
             raise FileNotFoundError(f"Schema not found: {self.schema_path}")
 
-        with open(self.schema_path, "r", encoding="utf-8") as f:
-            self.schema = json.load(f)
-
-        self.validator = Draft202012Validator(self.schema)
+        # Compiled fast path for the common (valid) case; jsonschema is
+        # still used to report the full, ordered error list.
+        self.schema, self.validator, self._fast_validate = _compile_schema(
+            str(self.schema_path.resolve()),
+            self.schema_path.stat().st_mtime_ns,
+        )
 
     def validate_dict(self, ir: dict) -> IRValidationResult:
         """
         Validate an IR object already loaded as a dict.
         """
+        if self._fast_validate is not None:
+            try:
+                self._fast_validate(ir)
+                return IRValidationResult(valid=True)
+            except fastjsonschema.JsonSchemaValueException:
+                pass
+
         errors = sorted(
             self.validator.iter_errors(ir),
             key=attrgetter("path")
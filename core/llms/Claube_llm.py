@@ -6,7 +6,10 @@ class ClaudeLLM(BaseLLM):
 
     def __init__(self, api_key: str, model: str):
         self.model = model
+        self.api_key = api_key
         self.client = anthropic.Anthropic(api_key=api_key)
+        # created on the first agenerate() call, closed by aclose()
+        self.async_client = None
 
     def generate(self, prompt: str) -> tuple[str, object]:
 
@@ -21,5 +24,26 @@ class ClaudeLLM(BaseLLM):
 
         return response.content[0].text.strip(), response.usage
 
+    async def agenerate(self, prompt: str) -> tuple[str, object]:
+
+        if self.async_client is None:
+            self.async_client = anthropic.AsyncAnthropic(api_key=self.api_key)
+
+        response = await self.async_client.messages.create(
+            model=self.model,
+            max_tokens=1024,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0
+        )
+
+        return response.content[0].text.strip(), response.usage
+
+    async def aclose(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
     def close(self):
         pass
\ No newline at end of file
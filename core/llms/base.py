@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
@@ -9,3 +10,17 @@ class BaseLLM(ABC):
     @abstractmethod
     def generate(self, prompt: str) -> str:
         pass
+
+    async def agenerate(self, prompt: str):
+        """
+        Async variant of generate(). Adapters whose SDK ships an async client
+        override this; the default runs generate() in a worker thread.
+        """
+        return await asyncio.to_thread(self.generate, prompt)
+
+    async def aclose(self) -> None:
+        """
+        Release the async client, if agenerate() created one. Called by the
+        concurrent LLM stage before its event loop closes.
+        """
+        return None
@@ -1,4 +1,4 @@
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from nl2spec.core.llms.base import BaseLLM
 
 
@@ -11,6 +11,9 @@ class DeepSeekLLM(BaseLLM):
             api_key=api_key,
             base_url="https://api.deepseek.com"
         )
+        self.api_key = api_key
+        # criado na primeira chamada de agenerate(), fechado em aclose()
+        self.async_client = None
 
     def generate(self, prompt: str) -> tuple[str, object]:
         response = self.client.chat.completions.create(
@@ -22,6 +25,27 @@ class DeepSeekLLM(BaseLLM):
         )
         return response.choices[0].message.content.strip(), response.usage
 
+    async def agenerate(self, prompt: str) -> tuple[str, object]:
+        if self.async_client is None:
+            self.async_client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url="https://api.deepseek.com"
+            )
+
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0
+        )
+        return response.choices[0].message.content.strip(), response.usage
+
+    async def aclose(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
     def close(self):
         # Mantido por compatibilidade com a classe base
         pass
\ No newline at end of file
@@ -7,6 +7,8 @@ class GeminiLLM(BaseLLM):
     def __init__(self, api_key: str, model: str):
         self.model = model
         self.client = genai.Client(api_key=api_key)
+        # client.aio, taken on the first agenerate() call, closed by aclose()
+        self.async_client = None
 
     def generate(self, prompt: str) -> tuple[str, object]:
         response = self.client.models.generate_content(
@@ -17,6 +19,26 @@ class GeminiLLM(BaseLLM):
 
         return response.text.strip(), response.usage_metadata
 
+    async def agenerate(self, prompt: str) -> tuple[str, object]:
+        if self.async_client is None:
+            self.async_client = self.client.aio
+
+        response = await self.async_client.models.generate_content(
+            model=self.model,
+            contents=prompt,
+            config={'temperature' : 0}
+        )
+
+        return response.text.strip(), response.usage_metadata
+
+    async def aclose(self) -> None:
+        if self.async_client is not None:
+            # AsyncClient.aclose() only exists in newer google-genai releases
+            aclose = getattr(self.async_client, "aclose", None)
+            if aclose is not None:
+                await aclose()
+            self.async_client = None
+
     def close(self):
         # libera conexões HTTP internas
         self.client.close()
@@ -1,4 +1,4 @@
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from nl2spec.core.llms.base import BaseLLM
 
 
@@ -6,7 +6,10 @@ class OpenAILLM(BaseLLM):
 
     def __init__(self, api_key: str, model: str):
         self.model = model
+        self.api_key = api_key
         self.client = OpenAI(api_key=api_key)
+        # created on the first agenerate() call, closed by aclose()
+        self.async_client = None
 
     def generate(self, prompt: str)-> tuple[str, object]:
 
@@ -20,6 +23,26 @@ class OpenAILLM(BaseLLM):
 
         return response.choices[0].message.content.strip(), response.usage
 
+    async def agenerate(self, prompt: str) -> tuple[str, object]:
+
+        if self.async_client is None:
+            self.async_client = AsyncOpenAI(api_key=self.api_key)
+
+        response = await self.async_client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0
+        )
+
+        return response.choices[0].message.content.strip(), response.usage
+
+    async def aclose(self) -> None:
+        if self.async_client is not None:
+            await self.async_client.close()
+            self.async_client = None
+
     def close(self):
         # não é obrigatório, mas mantemos padrão
         pass
\ No newline at end of file
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import csv
 import time
@@ -18,6 +19,27 @@ def _call_llm(llm, prompt, spec_id, provider, model,shot_mode,selection):
     raw, usage = llm.generate(prompt)
     end_ts = time.time()
 
+    return _handle_response(
+        raw, usage, start_ts, end_ts, spec_id, provider, model, shot_mode, selection
+    )
+
+
+async def _acall_llm(llm, prompt, spec_id, provider, model, shot_mode, selection):
+    agenerate = getattr(llm, "agenerate", None)
+
+    start_ts = time.time()
+    if agenerate is not None:
+        raw, usage = await agenerate(prompt)
+    else:
+        raw, usage = await asyncio.to_thread(llm.generate, prompt)
+    end_ts = time.time()
+
+    return _handle_response(
+        raw, usage, start_ts, end_ts, spec_id, provider, model, shot_mode, selection
+    )
+
+
+def _handle_response(raw, usage, start_ts, end_ts, spec_id, provider, model, shot_mode, selection):
     elapsed_ms = round((end_ts - start_ts) * 1000, 3)
 
     log.info(
@@ -213,6 +235,9 @@ def stage_llm(ctx, flags):
         # }
        # allowed_specs={"Throwable_InitCauseOnce"}
         allowed_ir_types = {"ere"}
+        concurrency = int(cfg["llm"].get("concurrency", 1))
+        jobs = []
+
         for prompt_file in prompts_root.rglob("*.txt"):
             spec_id = prompt_file.stem
             ir_type = prompt_file.parent.name.lower()
@@ -229,7 +254,7 @@ def stage_llm(ctx, flags):
             
             domain = extract_domain_from_prompt(prompt)
             
-            if total >= max_prompts:
+            if total + len(jobs) >= max_prompts:
               log.info("Reached limit of %d prompts. Stopping test run.", max_prompts)
               break
 
@@ -238,50 +263,18 @@ def stage_llm(ctx, flags):
                 str(prompt_file), spec_id, ir_type, provider, model_name
             )
 
+            if concurrency > 1:
+                jobs.append((spec_id, ir_type, domain, prompt))
+                continue
+
             try:
-                result, start_ts, end_ts, elapsed_ms = _call_llm(
+                outcome = _call_llm(
                     llm, prompt, spec_id, provider, model_name,shot_mode,selection
                 )
-                
-                status = result["status"]
-                raw = result["raw"]
-                parsed = result["parsed"]
-                
-                #domain = ir.get("domain", "unknown")
-
-                target_dir = output_root / domain / ir_type
-                target_dir.mkdir(parents=True, exist_ok=True)
-
-                #out_file = target_dir / f"{spec_id}.json"
-                #out_file.write_text(json.dumps(ir, indent=2), encoding="utf-8")
-
-                if status == "ok":
-                    out_file = target_dir / f"{spec_id}.json"
-                    with open(out_file, "w", encoding="utf-8") as f:
-                        json.dump(parsed, f, indent=2, ensure_ascii=False)
-
-                elif status == "syntax_fail":
-                    out_file = target_dir / f"{spec_id}.txt"
-                    out_file.write_text(raw, encoding="utf-8")
-                elif status == "schema_fail":
-                    out_file = target_dir / f"{spec_id}_schema_fail.txt"
-                    out_file.write_text(raw, encoding="utf-8")
-     
-                writer.writerow([
-                    spec_id,
-                    status,
-                    provider,
-                    model_name,
-                    selection,
-                    shot_mode,
-                    k,
-                    domain,
-                    ir_type,
-                    start_ts,
-                    end_ts,
-                    elapsed_ms
-                ])
-                f.flush()
+                status, elapsed_ms = _save_result(
+                    outcome, output_root, writer, f,
+                    spec_id, provider, model_name, selection, shot_mode, k, domain, ir_type,
+                )
 
                 total += 1
                 total_time += elapsed_ms
@@ -294,6 +287,42 @@ def stage_llm(ctx, flags):
             except Exception as e:
                 log.error("LLM failed for %s: %s", spec_id, e)
 
+        # ----------------------------
+        # CONCURRENT REQUESTS (llm.concurrency > 1)
+        # ----------------------------
+        if jobs:
+            log.info("Sending %d prompts with concurrency=%d", len(jobs), concurrency)
+
+            def _on_result(job, outcome):
+                nonlocal total, total_time
+                spec_id, ir_type, domain, _ = job
+
+                if isinstance(outcome, Exception):
+                    log.error("LLM failed for %s: %s", spec_id, outcome)
+                    return
+
+                try:
+                    status, elapsed_ms = _save_result(
+                        outcome, output_root, writer, f,
+                        spec_id, provider, model_name, selection, shot_mode, k, domain, ir_type,
+                    )
+                except Exception as e:
+                    log.error("LLM failed for %s: %s", spec_id, e)
+                    return
+
+                total += 1
+                total_time += elapsed_ms
+
+                log.info(
+                    "[SAVED] id=%s | status=%s | domain=%s | type=%s | elapsed_ms=%.3f | accumulated_ms=%.3f",
+                    spec_id, status, domain, ir_type, elapsed_ms, total_time
+                )
+
+            asyncio.run(_run_concurrent(
+                llm, jobs, concurrency, provider, model_name, shot_mode, selection,
+                _on_result,
+            ))
+
     if hasattr(llm, "close"):
         llm.close()
 
@@ -304,6 +333,77 @@ def stage_llm(ctx, flags):
     log.info("TOTAL FILES PROCESSED: %d", total)
     log.info("TOTAL ACCUMULATED TIME: %s (%0.3f ms)", formatted_time, total_time)
     
+async def _run_concurrent(llm, jobs, concurrency, provider, model, shot_mode, selection, on_result):
+    """
+    Send all prompts, bounded by an asyncio.Semaphore, and hand each outcome
+    to on_result(job, outcome) as soon as it arrives, so an interrupted run
+    keeps every response received so far. Failed calls are passed as the
+    exception. The adapter's async client is closed before the loop ends.
+    """
+    sem = asyncio.Semaphore(concurrency)
+
+    async def _bounded(job):
+        spec_id, _, _, prompt = job
+        async with sem:
+            try:
+                return job, await _acall_llm(
+                    llm, prompt, spec_id, provider, model, shot_mode, selection
+                )
+            except Exception as e:
+                return job, e
+
+    try:
+        for next_done in asyncio.as_completed([_bounded(job) for job in jobs]):
+            job, outcome = await next_done
+            on_result(job, outcome)
+    finally:
+        aclose = getattr(llm, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def _save_result(outcome, output_root, writer, f,
+                 spec_id, provider, model_name, selection, shot_mode, k, domain, ir_type):
+    result, start_ts, end_ts, elapsed_ms = outcome
+
+    status = result["status"]
+    raw = result["raw"]
+    parsed = result["parsed"]
+
+    target_dir = output_root / domain / ir_type
+    target_dir.mkdir(parents=True, exist_ok=True)
+
+    if status == "ok":
+        out_file = target_dir / f"{spec_id}.json"
+        with open(out_file, "w", encoding="utf-8") as out:
+            json.dump(parsed, out, indent=2, ensure_ascii=False)
+
+    elif status == "syntax_fail":
+        out_file = target_dir / f"{spec_id}.txt"
+        out_file.write_text(raw, encoding="utf-8")
+    elif status == "schema_fail":
+        out_file = target_dir / f"{spec_id}_schema_fail.txt"
+        out_file.write_text(raw, encoding="utf-8")
+
+    writer.writerow([
+        spec_id,
+        status,
+        provider,
+        model_name,
+        selection,
+        shot_mode,
+        k,
+        domain,
+        ir_type,
+        start_ts,
+        end_ts,
+        elapsed_ms
+    ])
+    f.flush()
+
+    return status, elapsed_ms
+
+
 def format_ms(ms: float) -> str:
     total_seconds = int(ms // 1000)
     milliseconds = int(ms % 1000)
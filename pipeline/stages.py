@@ -80,6 +80,7 @@ def stage_generate(ctx, flags: PipelineFlags) -> None:
                    shot_mode=shot_mode,
                    selection=selection,
                    save=True,
+                   validate_fewshot=cfg["prompting"].get("validate_fewshot", True),
                 )
 
                 total += 1
@@ -115,6 +116,7 @@ def stage_tests(ctx, flags: PipelineFlags) -> None:
 
     log.info("Tests completed successfully")
 
+
 def stage_prepare_datasets(cfg, flags):
     log.info("Stage: prepare datasets")
 
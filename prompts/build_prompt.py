@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pathlib import Path
 import json
+import sys
 from typing import List, Optional
 from nl2spec.logging_utils import get_logger
 
@@ -11,12 +13,28 @@ PROMPT_DIR = Path(__file__).parent
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 GENERATED_DIR = PROJECT_ROOT / "nl2spec" / "output" / "prompt"
 
-SUPPORTED_IR_TYPES = {"fsm", "ere", "event", "ltl"}
+SUPPORTED_IR_TYPES = frozenset({"fsm", "ere", "event", "ltl"})
+
+# ---------- template paths (resolved once at import) ----------
+HEADER_PATH = PROMPT_DIR / "templates" / "base" / "header.txt"
+CONTEXT_PATHS = {
+    t: PROMPT_DIR / "templates" / t / f"context_{t}.txt"
+    for t in SUPPORTED_IR_TYPES
+}
+
+
+@lru_cache(maxsize=1024)
+def _read_text(path: str, mtime_ns: int) -> str:
+    return Path(path).read_text(encoding="utf-8")
 
 
 def _load(path: Path) -> str:
+    """
+    Read a template or few-shot file. The text is reused across prompts
+    until the file's mtime changes.
+    """
     log.debug("Loading prompt file: %s", path)
-    return path.read_text(encoding="utf-8")
+    return _read_text(str(path), path.stat().st_mtime_ns)
 
 
 def _save_prompt(
@@ -47,30 +65,15 @@ def _save_prompt(
     log.info("Prompt saved to: %s", prompt_path)
 
 
-def build_prompt(
+def _prompt_text(
     ir_type: str,
     nl_text: str,
     fewshot_files: List[Path],
-    *,
-    scenario_id: Optional[str] = None,
-    shot_mode: str,
-    selection: str,
-    save: bool = False,
-    output_dir: Optional[Path] = None,
+    validate_fewshot: bool,
 ) -> str:
-
-    ir_type = ir_type.lower()
-    if ir_type not in SUPPORTED_IR_TYPES:
-        raise ValueError(
-            f"Unsupported ir_type '{ir_type}'. "
-            f"Supported types: {SUPPORTED_IR_TYPES}"
-        )
-
-    log.info("Building prompt for IR type: %s | shot_mode: %s", ir_type, shot_mode)
-
     # ---------- fixed prompt parts ----------
-    header_path = PROMPT_DIR / "templates" / "base" / "header.txt"
-    context_path = PROMPT_DIR / "templates" / ir_type / f"context_{ir_type}.txt"
+    header_path = HEADER_PATH
+    context_path = CONTEXT_PATHS[ir_type]
 
     if not header_path.exists():
         raise FileNotFoundError(f"Prompt header not found: {header_path}")
@@ -83,10 +86,12 @@ def build_prompt(
 
     # ---------- few-shot examples ----------
     examples = []
-    for fs in fewshot_files:
-        log.debug("Loading few-shot example: %s", fs)
-        data = json.loads(fs.read_text(encoding="utf-8"))
-        examples.append(json.dumps(data, indent=2))
+    for fs in map(Path, fewshot_files):
+        text = _load(fs).strip()
+        # few-shot text is embedded verbatim; parsing only checks it is JSON
+        if validate_fewshot:
+            json.loads(text)
+        examples.append(text)
 
     if examples:
         fewshot_block = "\n\n".join(
@@ -115,11 +120,32 @@ Natural Language Specification:
         len(examples),
     )
 
-    prompt = "\n\n".join([
-        header,
-        context_template,
-        task_block
-    ])
+    return f"{header}\n\n{context_template}\n\n{task_block}"
+
+
+def build_prompt(
+    ir_type: str,
+    nl_text: str,
+    fewshot_files: List[Path],
+    *,
+    scenario_id: Optional[str] = None,
+    shot_mode: str,
+    selection: str,
+    save: bool = False,
+    output_dir: Optional[Path] = None,
+    validate_fewshot: bool = True,
+) -> str:
+
+    ir_type = sys.intern(ir_type.lower())
+    if ir_type not in SUPPORTED_IR_TYPES:
+        raise ValueError(
+            f"Unsupported ir_type '{ir_type}'. "
+            f"Supported types: {sorted(SUPPORTED_IR_TYPES)}"
+        )
+
+    log.info("Building prompt for IR type: %s | shot_mode: %s", ir_type, shot_mode)
+
+    prompt = _prompt_text(ir_type, nl_text, fewshot_files, validate_fewshot)
 
     if save and scenario_id:
         _save_prompt(
@@ -131,4 +157,5 @@ Natural Language Specification:
            output_dir=output_dir,
         )
 
-    return prompt
\ No newline at end of file
+    return prompt
+
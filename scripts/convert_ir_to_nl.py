@@ -14,11 +14,20 @@ Key policy:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, Iterator, List, Set, Tuple
 import json
+import os
 import sys
 import shutil
 
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as fallback
+    orjson = None
+
 
 # ==========================================================
 # PATHS
@@ -29,6 +38,9 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 IR_ROOT = PROJECT_ROOT / "nl2spec" / "datasets" / "baseline_ir"
 NL_ROOT = PROJECT_ROOT / "nl2spec" / "datasets" / "baseline_nl"
 
+# IR files read concurrently per batch.
+READ_BATCH = 256
+
 
 # ==========================================================
 # UTILS
@@ -43,42 +55,119 @@ def ask_overwrite(path: Path) -> bool:
     return answer in {"y", "yes"}
 
 
+_DOMAINS = frozenset(("io", "lang", "util", "net", "concurrent"))
+
+
 def infer_domain(data: dict, ir_file: Path) -> str:
     # 1) Prefer domain stored in JSON
     dom = data.get("domain")
     if isinstance(dom, str) and dom.strip():
         return dom.strip().lower()
 
-    # 2) Fallback: infer from IR path (baseline_ir/<domain>/...)
-    parts = [p.lower() for p in ir_file.parts]
-    for d in ("io", "lang", "util", "net", "concurrent"):
-        if d in parts:
-            return d
+    # 2) Fallback: infer from IR path (baseline_ir/<domain>/...). Only the
+    #    part below IR_ROOT is scanned so a checkout under e.g. /home/io/
+    #    does not leak into the domain.
+    try:
+        parts = ir_file.relative_to(IR_ROOT).parts
+    except ValueError:
+        parts = ir_file.parts
+
+    return next(
+        (d for d in (p.lower() for p in parts) if d in _DOMAINS),
+        "other",
+    )
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: Path) -> Path:
+    """
+    mkdir once per directory; later calls are a cache hit instead of a
+    syscall. Cleared by main() whenever the output tree is recreated.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
 
-    return "other"
+def iter_json_files(root: Path) -> Iterator[Path]:
+    """
+    Walk `root` with os.scandir, yielding .json files without the extra
+    stat() per entry that rglob performs.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    yield Path(entry.path)
 
 
 def safe_read_json(path: Path) -> dict:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        raw = path.read_bytes()
+    except Exception as e:
+        raise RuntimeError(f"Failed to read JSON: {path}\nReason: {e}") from e
+    return safe_load_json(raw, path)
+
+
+def safe_load_json(raw: bytes, path: Path) -> dict:
+    try:
+        if orjson is not None:
+            return orjson.loads(raw)
+        return json.loads(raw.decode("utf-8"))
     except Exception as e:
         raise RuntimeError(f"Failed to read JSON: {path}\nReason: {e}") from e
 
 
-def unique_out_path(out_dir: Path, spec_id: str) -> Path:
+def read_many(paths: List[Path], pool: ThreadPoolExecutor) -> List[bytes]:
+    """
+    Read a batch of small files concurrently. File reads release the GIL, so
+    the open/read latency of the whole batch overlaps instead of adding up.
+    """
+    return list(pool.map(Path.read_bytes, paths))
+
+
+def write_file(path: Path, data: bytes) -> None:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # os.write may write less than asked; loop until the buffer is out
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def unique_out_path(
+    out_dir: Path,
+    spec_id: str,
+    claimed: Set[str],
+    next_index: Dict[Tuple[str, str], int],
+) -> Path:
     """
     Avoid overwriting when multiple IR files share the same id in the same domain.
+
+    Resolved in memory, without stat() probes: NL_ROOT is recreated by
+    main(), so the only taken names are those already handed out
+    (`claimed`). Names are compared case-folded, since Foo.txt and foo.txt
+    are the same file on case-insensitive filesystems (macOS, Windows).
+    `next_index` remembers the next suffix to try per (out_dir, spec_id);
+    names below it are already claimed.
     """
-    out_file = out_dir / f"{spec_id}.txt"
-    if not out_file.exists():
-        return out_file
+    key = (str(out_dir).casefold(), spec_id.casefold())
+    i = next_index.get(key, 1)
 
-    i = 2
     while True:
-        candidate = out_dir / f"{spec_id}__{i}.txt"
-        if not candidate.exists():
-            return candidate
+        candidate = out_dir / (f"{spec_id}.txt" if i == 1 else f"{spec_id}__{i}.txt")
         i += 1
+        folded = str(candidate).casefold()
+        if folded not in claimed:
+            break
+
+    next_index[key] = i
+    claimed.add(folded)
+    return candidate
 
 
 # ==========================================================
@@ -103,6 +192,54 @@ def pick_violation_message(data: dict) -> str | None:
     return None
 
 
+def _fb_event(ir: dict, spec_id: str) -> str:
+    events = ir.get("events", [])
+    if events and isinstance(events, list):
+        e0 = events[0] or {}
+        name = e0.get("name", "some event")
+        timing = e0.get("timing", "")
+        if timing:
+            return f"[{spec_id}] Forbidden event: {name} ({timing})."
+        return f"[{spec_id}] Forbidden event: {name}."
+    return f"[{spec_id}] Forbidden event specification."
+
+
+def _fb_ere(ir: dict, spec_id: str) -> str:
+    # ✅ no schema/conversor é "pattern", não "expression"
+    pattern = ir.get("pattern")
+    if isinstance(pattern, str) and pattern.strip():
+        return f"[{spec_id}] The execution must match the event pattern: {pattern.strip()}."
+    return f"[{spec_id}] Event pattern constraint (ERE)."
+
+
+def _fb_fsm(ir: dict, spec_id: str) -> str:
+    transitions = ir.get("transitions", []) or []
+    events = {
+        str(tr["event"]).strip()
+        for tr in transitions
+        if isinstance(tr, dict) and "event" in tr
+    }
+    if events:
+        evs = ", ".join(sorted(e for e in events if e))
+        return f"[{spec_id}] Finite-state rule over events: {evs}."
+    return f"[{spec_id}] Finite-state usage rule (FSM)."
+
+
+def _fb_ltl(ir: dict, spec_id: str) -> str:
+    formula = ir.get("formula")
+    if isinstance(formula, str) and formula.strip():
+        return f"[{spec_id}] Temporal property (LTL): {formula.strip()}."
+    return f"[{spec_id}] Temporal property (LTL)."
+
+
+_FALLBACKS = {
+    "EVENT": _fb_event,
+    "ERE": _fb_ere,
+    "FSM": _fb_fsm,
+    "LTL": _fb_ltl,
+}
+
+
 def fallback_nl(data: dict) -> str:
     """
     Minimal fallback when violation_message is missing.
@@ -112,42 +249,12 @@ def fallback_nl(data: dict) -> str:
     spec_id = data.get("id") or "unknown_id"
 
     ir = data.get("ir", {})
-    t = (ir.get("type") or "").lower()
 
-    if cat == "EVENT":
-        events = ir.get("events", [])
-        if events and isinstance(events, list):
-            e0 = events[0] or {}
-            name = e0.get("name", "some event")
-            timing = e0.get("timing", "")
-            if timing:
-                return f"[{spec_id}] Forbidden event: {name} ({timing})."
-            return f"[{spec_id}] Forbidden event: {name}."
-        return f"[{spec_id}] Forbidden event specification."
-
-    if cat == "ERE":
-        # ✅ no schema/conversor é "pattern", não "expression"
-        pattern = ir.get("pattern")
-        if isinstance(pattern, str) and pattern.strip():
-            return f"[{spec_id}] The execution must match the event pattern: {pattern.strip()}."
-        return f"[{spec_id}] Event pattern constraint (ERE)."
-
-    if cat == "FSM":
-        events = set()
-        for tr in ir.get("transitions", []) or []:
-            if isinstance(tr, dict) and "event" in tr:
-                events.add(str(tr["event"]).strip())
-        if events:
-            evs = ", ".join(sorted(e for e in events if e))
-            return f"[{spec_id}] Finite-state rule over events: {evs}."
-        return f"[{spec_id}] Finite-state usage rule (FSM)."
-
-    if cat == "LTL":
-        formula = ir.get("formula")
-        if isinstance(formula, str) and formula.strip():
-            return f"[{spec_id}] Temporal property (LTL): {formula.strip()}."
-        return f"[{spec_id}] Temporal property (LTL)."
+    handler = _FALLBACKS.get(cat)
+    if handler is not None:
+        return handler(ir, spec_id)
 
+    t = (ir.get("type") or "").lower()
     if t:
         return f"[{spec_id}] Constraint of type: {t}."
     return f"[{spec_id}] Constraint (unknown category)."
@@ -184,26 +291,34 @@ def main() -> None:
         shutil.rmtree(NL_ROOT)
 
     NL_ROOT.mkdir(parents=True, exist_ok=True)
+    _ensure_dir.cache_clear()
 
     total = 0
     by_domain: dict[str, int] = {}
 
-    for ir_file in IR_ROOT.rglob("*.json"):
-        data = safe_read_json(ir_file)
+    ir_files = list(iter_json_files(IR_ROOT))
+    claimed: Set[str] = set()
+    next_index: Dict[Tuple[str, str], int] = {}
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        for start in range(0, len(ir_files), READ_BATCH):
+            batch = ir_files[start:start + READ_BATCH]
+
+            for ir_file, raw in zip(batch, read_many(batch, pool)):
+                data = safe_load_json(raw, ir_file)
 
-        spec_id = data.get("id") or ir_file.stem
-        domain = infer_domain(data, ir_file)
+                spec_id = data.get("id") or ir_file.stem
+                domain = infer_domain(data, ir_file)
 
-        out_dir = NL_ROOT / domain
-        out_dir.mkdir(parents=True, exist_ok=True)
+                out_dir = _ensure_dir(NL_ROOT / domain)
 
-        nl_text = ir_to_nl(data).strip() + "\n"
+                nl_text = ir_to_nl(data).strip() + "\n"
 
-        out_file = unique_out_path(out_dir, spec_id)
-        out_file.write_text(nl_text, encoding="utf-8")
+                out_file = unique_out_path(out_dir, spec_id, claimed, next_index)
+                write_file(out_file, nl_text.encode("utf-8"))
 
-        total += 1
-        by_domain[domain] = by_domain.get(domain, 0) + 1
+                total += 1
+                by_domain[domain] = by_domain.get(domain, 0) + 1
 
     print("=" * 70)
     print(f"[OK] NL specifications generated: {total}")
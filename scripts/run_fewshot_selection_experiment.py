@@ -128,6 +128,14 @@ def main():
         "ere": [],
     }
 
+    # Formalisms whose specs are analyzed; anything else is skipped with a
+    # single membership test right after parsing.
+    wanted = (
+        set(rows_by_formalism)
+        if TARGET_FORMALISM == "all"
+        else {TARGET_FORMALISM}
+    )
+
     total = 0
 
     #for domain_dir in BASELINE_DIR.iterdir():
@@ -140,10 +148,7 @@ def main():
             spec_json = load_json(file_path)
             ir_type = get_ir_type(spec_json)
 
-            if ir_type not in rows_by_formalism:
-                continue
-
-            if TARGET_FORMALISM != "all" and ir_type != TARGET_FORMALISM:
+            if ir_type not in wanted:
                 continue
 
             total += 1
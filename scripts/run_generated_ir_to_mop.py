@@ -1,9 +1,19 @@
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
+from typing import IO, Dict, Iterator, Optional, Set, Tuple
+import argparse
 import json
+import os
 import sys
 import shutil
 
-# run # run: python -m nl2spec.scripts.run_generated_ir_to_mop
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as fallback
+    orjson = None
+
+# run # run: python -m nl2spec.scripts.run_generated_ir_to_mop [--verbose]
 
 # ==========================================================
 # PATHS
@@ -13,11 +23,19 @@ PROJECT_ROOT = Path(__file__).resolve().parent
 IR_INPUT_DIR = PROJECT_ROOT / "datasets" / "baseline_ir_temp"
 MOP_OUTPUT_DIR = PROJECT_ROOT / "datasets" / "reconstructed_mop"
 
+# {relative input path: [blake2b of the input, ir_type]} of the last run.
+MANIFEST_PATH = MOP_OUTPUT_DIR / ".manifest.json"
+
 
 # ==========================================================
 # UTILS
 # ==========================================================
 
+# Shared read-only default for missing sub-objects (never mutated), so
+# lookups like event.get("body", _EMPTY_DICT) do not allocate a new dict.
+_EMPTY_DICT: dict = {}
+
+
 def ask_overwrite(path: Path) -> bool:
     answer = input(
         f"[WARN] Output directory exists:\n"
@@ -27,9 +45,49 @@ def ask_overwrite(path: Path) -> bool:
     return answer in {"y", "yes"}
 
 
+def iter_json_files(root: Path) -> Iterator[Tuple[str, int]]:
+    """
+    Walk `root` with os.scandir, yielding (path, size) for .json files.
+    DirEntry caches the file type, so no extra stat() is issued for
+    directories; the size lets workers read each file with one os.read.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                    yield entry.path, entry.stat(follow_symlinks=False).st_size
+
+
+def _read_file(path: str, size: int) -> bytes:
+    """
+    Read a whole file with os.read, sized from the directory walk.
+    Asking for one byte more than `size` detects a file that grew since
+    the walk; the rest is then read until EOF.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, size + 1)
+        if len(data) <= size:
+            return data
+
+        parts = [data]
+        while True:
+            chunk = os.read(fd, 1 << 16)
+            if not chunk:
+                return b"".join(parts)
+            parts.append(chunk)
+    finally:
+        os.close(fd)
+
+
 def _format_signature(signature: dict) -> str:
-    params = signature.get("parameters", [])
-    return ", ".join(f"{p['type']} {p['name']}" for p in params)
+    params = signature.get("parameters")
+    if not params:
+        return ""
+    return ", ".join([f"{p['type']} {p['name']}" for p in params])
 
 
 def _format_event_prefix(event: dict) -> str:
@@ -38,217 +96,332 @@ def _format_event_prefix(event: dict) -> str:
     return "creation event" if kind == "creation" else "event"
 
 
-def _emit_violation_if_present(lines: list, vio: dict):
+def _format_event_header(event: dict, prefix: str = None) -> str:
+    """
+    "    <prefix> <name> <timing>(<params>)[ returning(<type> <name>)] :"
+    prefix defaults to _format_event_prefix(event).
+    """
+    if prefix is None:
+        prefix = _format_event_prefix(event)
+
+    params_list = event.get("parameters")
+    params = (
+        ", ".join([f"{p['type']} {p['name']}" for p in params_list])
+        if params_list
+        else ""
+    )
+
+    ret = ""
+    if "returning" in event:
+        r = event["returning"]
+        ret = f" returning({r['type']} {r['name']})"
+
+    return f"    {prefix} {event['name']} {event['timing']}({params}){ret} :"
+
+
+def _render_violation(vio: dict) -> str:
     """
     Só emite @fail/@violation/@match se:
       - tag existe
       - e/ou raw_block não é vazio
+    Retorna "" quando não há nada a emitir.
     """
     if not vio:
-        return
+        return ""
 
     tag = vio.get("tag")
-    raw_block = vio.get("raw_block", [])
+    raw_block = vio.get("raw_block", ())
 
     # Se não tem tag e não tem conteúdo, não emite nada.
     if (tag is None or str(tag).strip() == "") and not raw_block:
-        return
+        return ""
 
     tag = (tag or "violation").lower()
 
-    lines.append(f"    @{tag} {{")
-    for ln in raw_block:
-        lines.append(f"        {ln}")
-    lines.append("    }")
+    body = "".join(f"        {ln}\n" for ln in raw_block)
+    return f"    @{tag} {{\n{body}    }}"
+
 
+def _write_violation(out: IO[str], vio: dict):
+    block = _render_violation(vio)
+    if block:
+        out.write(block)
+        out.write("\n")
 
-def _emit_event_block(lines: list, pointcut: str, body_lines: list):
+
+def _write_event_block(out: IO[str], pointcut: str, body_lines):
     """
-    Emite o bloco do event com chaves exatamente 1x.
+    Emite o bloco do event com chaves exatamente 1x, seguido da linha em
+    branco que separa os blocos.
     """
-    lines.append(f"        {pointcut} {{")
+    out.write(f"        {pointcut} {{\n")
     for bl in body_lines:
-        lines.append(f"        {bl}")
-    lines.append("        }\n")
+        out.write(f"        {bl}\n")
+    out.write("        }\n\n")
 
 
 # ==========================================================
 # RECONSTRUCTION — LTL
 # ==========================================================
 
-def reconstruct_ltl(ir_json: dict) -> str:
+def reconstruct_ltl(ir_json: dict, out: IO[str]) -> None:
     spec_id = ir_json["id"]
-    signature = ir_json.get("signature", {})
+    signature = ir_json.get("signature", _EMPTY_DICT)
     ir = ir_json["ir"]
 
-    lines = []
-    lines.append(f"{spec_id}({_format_signature(signature)}) {{\n")
-
-    for event in ir.get("events", []):
-        name = event["name"]
-        timing = event["timing"]
+    w = out.write
+    w(f"{spec_id}({_format_signature(signature)}) {{\n\n")
 
-        params = ", ".join(f"{p['type']} {p['name']}" for p in event.get("parameters", []))
-        header = f"    event {name} {timing}({params})"
-
-        if "returning" in event:
-            r = event["returning"]
-            header += f" returning({r['type']} {r['name']})"
-
-        header += " :"
-        lines.append(header)
+    for event in ir.get("events", ()):
+        # LTL: sempre "event" (sem creation)
+        w(_format_event_header(event, prefix="event"))
+        w("\n")
 
         # LTL: pointcut estruturado
-        pointcut = event.get("pointcut", {}).get("raw", "")
-        _emit_event_block(lines, pointcut, body_lines=[])
+        pointcut = event.get("pointcut", _EMPTY_DICT).get("raw", "")
+        _write_event_block(out, pointcut, body_lines=())
 
-    formula = ir.get("formula", {}).get("raw", "")
-    lines.append(f"    ltl : {formula}\n")
+    formula = ir.get("formula", _EMPTY_DICT).get("raw", "")
+    w(f"    ltl : {formula}\n\n")
 
-    _emit_violation_if_present(lines, ir.get("violation", {}))
+    _write_violation(out, ir.get("violation", _EMPTY_DICT))
 
-    lines.append("}")
-    return "\n".join(lines)
+    w("}")
 
 
 # ==========================================================
 # RECONSTRUCTION — ERE
 # ==========================================================
 
-def reconstruct_ere(ir_json: dict) -> str:
+def reconstruct_ere(ir_json: dict, out: IO[str]) -> None:
     spec_id = ir_json["id"]
-    signature = ir_json.get("signature", {})
+    signature = ir_json.get("signature", _EMPTY_DICT)
     ir = ir_json["ir"]
 
-    lines = []
-    lines.append(f"{spec_id}({_format_signature(signature)}) {{\n")
-
-    for event in ir.get("events", []):
-        prefix = _format_event_prefix(event)
-        name = event["name"]
-        timing = event["timing"]
-
-        params = ", ".join(f"{p['type']} {p['name']}" for p in event.get("parameters", []))
-        header = f"    {prefix} {name} {timing}({params})"
-
-        if "returning" in event:
-            r = event["returning"]
-            header += f" returning({r['type']} {r['name']})"
+    w = out.write
+    w(f"{spec_id}({_format_signature(signature)}) {{\n\n")
 
-        header += " :"
-        lines.append(header)
+    for event in ir.get("events", ()):
+        w(_format_event_header(event))
+        w("\n")
 
         # ERE: pointcut estruturado (igual LTL)
-        pointcut = event.get("pointcut", {}).get("raw", "")
+        pointcut = event.get("pointcut", _EMPTY_DICT).get("raw", "")
         # ERE normalmente não precisa de body; mas se vier, emitimos fielmente
-        body_lines = event.get("body", {}).get("raw_lines", [])
-        _emit_event_block(lines, pointcut, body_lines)
+        body_lines = event.get("body", _EMPTY_DICT).get("raw_lines", ())
+        _write_event_block(out, pointcut, body_lines)
 
-    formula = ir.get("formula", {}).get("raw", "")
-    lines.append(f"    ere : {formula}\n")
+    formula = ir.get("formula", _EMPTY_DICT).get("raw", "")
+    w(f"    ere : {formula}\n\n")
 
-    _emit_violation_if_present(lines, ir.get("violation", {}))
+    _write_violation(out, ir.get("violation", _EMPTY_DICT))
 
-    lines.append("}")
-    return "\n".join(lines)
+    w("}")
 
 
 # ==========================================================
 # RECONSTRUCTION — FSM
 # ==========================================================
 
-def reconstruct_fsm(ir_json: dict) -> str:
+def reconstruct_fsm(ir_json: dict, out: IO[str]) -> None:
     spec_id = ir_json["id"]
-    signature = ir_json.get("signature", {})
+    signature = ir_json.get("signature", _EMPTY_DICT)
     ir = ir_json["ir"]
 
-    lines = []
-    lines.append(f"{spec_id}({_format_signature(signature)}) {{\n")
+    w = out.write
+    w(f"{spec_id}({_format_signature(signature)}) {{\n\n")
 
-    for event in ir.get("events", []):
-        prefix = _format_event_prefix(event)
-        name = event["name"]
-        timing = event["timing"]
-
-        params = ", ".join(f"{p['type']} {p['name']}" for p in event.get("parameters", []))
-        header = f"    {prefix} {name} {timing}({params})"
-
-        if "returning" in event:
-            r = event["returning"]
-            header += f" returning({r['type']} {r['name']})"
-
-        header += " :"
-        lines.append(header)
+    for event in ir.get("events", ()):
+        w(_format_event_header(event))
+        w("\n")
 
         # FSM: pointcut_raw (não estruturado)
         pointcut = event.get("pointcut_raw", "")
-        body_lines = event.get("body", {}).get("raw_lines", [])
-        _emit_event_block(lines, pointcut, body_lines)
+        body_lines = event.get("body", _EMPTY_DICT).get("raw_lines", ())
+        _write_event_block(out, pointcut, body_lines)
 
     # FSM block
-    lines.append("    fsm :")
-    raw_lines = ir.get("fsm", {}).get("raw_lines", [])
+    w("    fsm :\n")
+    raw_lines = ir.get("fsm", _EMPTY_DICT).get("raw_lines", ())
     for ln in raw_lines:
-        lines.append(ln)
-    lines.append("")
+        w(f"{ln}\n")
+    w("\n")
 
-    _emit_violation_if_present(lines, ir.get("violation", {}))
+    _write_violation(out, ir.get("violation", _EMPTY_DICT))
 
-    lines.append("}")
-    return "\n".join(lines)
+    w("}")
 
 
 # ==========================================================
 # RECONSTRUCTION — EVENT
 # ==========================================================
 
-def reconstruct_event(ir_json: dict) -> str:
+def reconstruct_event(ir_json: dict, out: IO[str]) -> None:
     """
     EVENT é especial:
     - Pode NÃO ter @fail/@violation/@match no final.
     - A “violação” pode estar embutida no corpo do evento (try/catch, prints, etc.).
     """
     spec_id = ir_json["id"]
-    signature = ir_json.get("signature", {})
+    signature = ir_json.get("signature", _EMPTY_DICT)
     ir = ir_json["ir"]
 
-    lines = []
-    lines.append(f"{spec_id}({_format_signature(signature)}) {{\n")
+    w = out.write
+    w(f"{spec_id}({_format_signature(signature)}) {{\n\n")
 
-    for event in ir.get("events", []):
+    for event in ir.get("events", ()):
         # EVENT não tem creation keyword no corpus que você mostrou,
         # mas deixo compatível caso apareça.
-        prefix = _format_event_prefix(event)
-        name = event["name"]
-        timing = event["timing"]
-
-        params = ", ".join(f"{p['type']} {p['name']}" for p in event.get("parameters", []))
-        header = f"    {prefix} {name} {timing}({params})"
-
-        if "returning" in event:
-            r = event["returning"]
-            header += f" returning({r['type']} {r['name']})"
-
-        header += " :"
-        lines.append(header)
+        w(_format_event_header(event))
+        w("\n")
 
         # EVENT: pointcut_raw
         pointcut = event.get("pointcut_raw", "")
-        body_lines = event.get("body", {}).get("raw_lines", [])
-        _emit_event_block(lines, pointcut, body_lines)
+        body_lines = event.get("body", _EMPTY_DICT).get("raw_lines", ())
+        _write_event_block(out, pointcut, body_lines)
 
     # EVENT: só emite bloco @... se de fato existir no JSON
-    _emit_violation_if_present(lines, ir.get("violation", {}))
+    _write_violation(out, ir.get("violation", _EMPTY_DICT))
+
+    w("}")
+
+
+# ==========================================================
+# DISPATCH
+# ==========================================================
+
+_DISPATCH = {
+    "ltl": reconstruct_ltl,
+    "fsm": reconstruct_fsm,
+    "ere": reconstruct_ere,
+    "event": reconstruct_event,
+}
+
+
+# ==========================================================
+# WORKER
+# ==========================================================
+
+# Output directories already created by this worker process.
+_made_dirs: Set[str] = set()
+
+# Write buffer of the streamed .mop output. The reconstructors write into
+# a text stream, so this replaces the earlier encode-then-os.write
+# _write_file. A .mop fits in the buffer, so each file is still flushed
+# with a single write() on close.
+_OUT_BUFFER = 1 << 16
+
+
+def _process_one(job: Tuple[str, int, str, Optional[list]]):
+    """
+    Load one IR JSON and stream its reconstructed MOP source straight into
+    the output file. Runs in a worker process.
+
+    `previous` is the manifest entry [digest, ir_type] from the last run;
+    when the input digest still matches (and the .mop is still there) the
+    file is neither parsed nor rewritten.
+
+    Returns (ir_type, status, digest), status being "written",
+    "unchanged" or "unknown" (IR type without reconstructor; no file).
+    """
+    json_file, size, output_file, previous = job
+
+    raw = _read_file(json_file, size)
+    digest = blake2b(raw, digest_size=16).hexdigest()
+
+    if previous is not None and previous[0] == digest:
+        prev_type = previous[1]
+        if prev_type not in _DISPATCH:
+            return prev_type, "unknown", digest
+        if os.path.exists(output_file):
+            return prev_type, "unchanged", digest
 
-    lines.append("}")
-    return "\n".join(lines)
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    ir_type = data["ir"]["type"]
+
+    reconstruct = _DISPATCH.get(ir_type)
+    if reconstruct is None:
+        # tipo mudou para desconhecido: remove o .mop antigo
+        if previous is not None and os.path.exists(output_file):
+            os.remove(output_file)
+        return ir_type, "unknown", digest
+
+    out_dir = os.path.dirname(output_file)
+    if out_dir not in _made_dirs:
+        os.makedirs(out_dir, exist_ok=True)
+        _made_dirs.add(out_dir)
+
+    try:
+        with open(output_file, "w", encoding="utf-8", buffering=_OUT_BUFFER) as out:
+            reconstruct(data, out)
+    except Exception:
+        # não deixa .mop parcial para trás
+        if os.path.exists(output_file):
+            os.remove(output_file)
+        raise
+
+    return ir_type, "written", digest
+
+
+# ==========================================================
+# MANIFEST
+# ==========================================================
+
+def _mop_path(out_root: str, rel: str) -> str:
+    return os.path.join(out_root, rel[:-len(".json")] + ".mop")
+
+
+def _script_version() -> str:
+    # Outputs depend on this file too: any edit invalidates the manifest.
+    return blake2b(Path(__file__).read_bytes(), digest_size=16).hexdigest()
+
+
+def _load_manifest() -> Optional[dict]:
+    try:
+        with open(MANIFEST_PATH, "rb") as f:
+            manifest = json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(manifest, dict) or not isinstance(manifest.get("files"), dict):
+        return None
+    return manifest
+
+
+def _save_manifest(version: str, files: Dict[str, list]) -> None:
+    tmp = MANIFEST_PATH.with_suffix(".tmp")
+    tmp.write_text(
+        json.dumps({"version": version, "files": files}, indent=2, sort_keys=True),
+        encoding="utf-8",
+    )
+    os.replace(tmp, MANIFEST_PATH)
 
 
 # ==========================================================
 # MAIN
 # ==========================================================
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Reconstruct MOP sources from baseline IR JSON files."
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print every processed file (default: summary only).",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Ignore the manifest and regenerate the whole output directory.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
     print("=" * 70)
     print("[INFO] Reconstructing MOP from IR JSON (LTL + FSM + ERE + EVENT)")
     print("[INFO] Source :", IR_INPUT_DIR)
@@ -259,7 +432,11 @@ def main():
         print("[ERROR] baseline_ir_temp not found.")
         sys.exit(1)
 
-    if MOP_OUTPUT_DIR.exists():
+    # Incremental run when a previous manifest exists; otherwise (or with
+    # --rebuild) the output directory is regenerated from scratch.
+    manifest = None if args.rebuild else _load_manifest()
+
+    if manifest is None and MOP_OUTPUT_DIR.exists():
         if not ask_overwrite(MOP_OUTPUT_DIR):
             print("[INFO] Aborted.")
             return
@@ -267,50 +444,75 @@ def main():
 
     MOP_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
-    count_ltl = 0
-    count_fsm = 0
-    count_ere = 0
-    count_event = 0
-
-    for json_file in IR_INPUT_DIR.rglob("*.json"):
-        print("Processing:", json_file)
-
-        with open(json_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        ir_type = data["ir"]["type"]
-
-        if ir_type == "ltl":
-            mop_code = reconstruct_ltl(data)
-            count_ltl += 1
-        elif ir_type == "fsm":
-            mop_code = reconstruct_fsm(data)
-            count_fsm += 1
-        elif ir_type == "ere":
-            mop_code = reconstruct_ere(data)
-            count_ere += 1
-        elif ir_type == "event":
-            mop_code = reconstruct_event(data)
-            count_event += 1
-        else:
-            # desconhecido: ignora silenciosamente
-            continue
-
-        relative = json_file.relative_to(IR_INPUT_DIR)
-        output_file = MOP_OUTPUT_DIR / relative.with_suffix(".mop")
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        output_file.write_text(mop_code, encoding="utf-8")
-
-    total = count_ltl + count_fsm + count_ere + count_event
+    version = _script_version()
+    old_files: Dict[str, list] = manifest["files"] if manifest else {}
+    reusable = manifest is not None and manifest.get("version") == version
+
+    if manifest is not None:
+        state = "reusing" if reusable else "script changed, regenerating"
+        print(f"[INFO] Manifest : {len(old_files)} entries ({state})")
+
+    counts = {ir_type: 0 for ir_type in _DISPATCH}
+    unchanged = 0
+    new_files: Dict[str, list] = {}
+
+    json_files = list(iter_json_files(IR_INPUT_DIR))
+
+    ir_root = str(IR_INPUT_DIR)
+    out_root = str(MOP_OUTPUT_DIR)
+
+    rels = [os.path.relpath(json_file, ir_root) for json_file, _ in json_files]
+    jobs = [
+        (
+            json_file,
+            size,
+            _mop_path(out_root, rel),
+            old_files.get(rel) if reusable else None,
+        )
+        for (json_file, size), rel in zip(json_files, rels)
+    ]
+
+    # Files are independent: reconstruct and write them in worker
+    # processes; the driver only prints and counts.
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(jobs) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        results = ex.map(_process_one, jobs, chunksize=chunksize)
+
+        for rel, (json_file, _, _, _), (ir_type, status, digest) in zip(rels, jobs, results):
+            if args.verbose:
+                print("Processing:", json_file)
+
+            new_files[rel] = [digest, ir_type]
+
+            if status == "unknown":
+                # desconhecido: ignora silenciosamente
+                continue
+
+            counts[ir_type] += 1
+            if status == "unchanged":
+                unchanged += 1
+
+    # Inputs removed since the last run: drop their outputs as well.
+    for rel in old_files.keys() - new_files.keys():
+        stale = _mop_path(out_root, rel)
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    _save_manifest(version, new_files)
+
+    total = sum(counts.values())
 
     print("=" * 70)
     print("[SUMMARY]")
-    print(f"  Reconstructed LTL   : {count_ltl}")
-    print(f"  Reconstructed FSM   : {count_fsm}")
-    print(f"  Reconstructed ERE   : {count_ere}")
-    print(f"  Reconstructed EVENT : {count_event}")
+    print(f"  Reconstructed LTL   : {counts['ltl']}")
+    print(f"  Reconstructed FSM   : {counts['fsm']}")
+    print(f"  Reconstructed ERE   : {counts['ere']}")
+    print(f"  Reconstructed EVENT : {counts['event']}")
     print("-" * 70)
     print(f"  Total Reconstructed : {total}")
+    print(f"  Unchanged (skipped) : {unchanged}")
     print("=" * 70)
 
 
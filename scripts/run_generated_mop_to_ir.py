@@ -1,9 +1,18 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Iterator
+import os
 import shutil
 import sys
 import json
 
-from core.convert.mop_to_ir import convert_mop_file_to_ir, detect_formalism
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used as fallback
+    orjson = None
+
+from core.convert.mop_to_ir import convert_mop_text_to_ir, detect_formalism
 
 # run: python -m nl2spec.scripts.run_generated_mop_to_ir
 
@@ -16,6 +25,10 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 MOP_ROOT = PROJECT_ROOT / "datasets" / "dataset_mop"
 OUT_ROOT = PROJECT_ROOT / "datasets" / "baseline_ir_temp"
 
+# String forms for the per-file target computation in the workers.
+MOP_ROOT_STR = str(MOP_ROOT)
+OUT_ROOT_STR = str(OUT_ROOT)
+
 
 # ==========================================================
 # UTILS
@@ -31,6 +44,75 @@ def ask_overwrite(path: Path) -> bool:
     return answer in {"y", "yes"}
 
 
+SUPPORTED = {"ltl", "fsm", "ere", "event"}
+
+
+def iter_mop_files(root: Path) -> Iterator[Path]:
+    """
+    Walk `root` with os.scandir, yielding .mop files. DirEntry caches the
+    file type, so no extra stat() is issued per entry.
+    """
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".mop"):
+                    yield Path(entry.path)
+
+
+def _dump_json(ir: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(ir, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(ir, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _ensure_dir(path: str) -> str:
+    """
+    mkdir once per directory and worker process; later calls are a cache
+    hit instead of a syscall. Only workers call this, and main() creates
+    its pool after rebuilding OUT_ROOT, so no worker holds entries for a
+    deleted tree. Clearing the cache in the driver would have no effect.
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _process_one(mop_file: Path):
+    """
+    Convert one .mop file and write its IR JSON.
+    Runs in a worker process; returns (file, formalism, error) and leaves
+    all printing to the driver.
+    """
+    with open(mop_file, "rb") as f:
+        data = f.read()
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        text = data.decode("utf-8", errors="replace")
+    formalism = detect_formalism(text)
+
+    if formalism not in SUPPORTED:
+        return mop_file, formalism, None
+
+    try:
+        ir = convert_mop_text_to_ir(text, mop_file)
+
+        relative = os.path.relpath(mop_file, MOP_ROOT_STR)
+        target = os.path.join(OUT_ROOT_STR, relative[:-len(".mop")] + ".json")
+        _ensure_dir(os.path.dirname(target))
+
+        with open(target, "wb") as f:
+            f.write(_dump_json(ir))
+
+    except Exception as e:
+        return mop_file, formalism, str(e)
+
+    return mop_file, formalism, None
+
+
 # ==========================================================
 # MAIN
 # ==========================================================
@@ -54,61 +136,37 @@ def main():
 
     OUT_ROOT.mkdir(parents=True, exist_ok=True)
 
-    converted_ltl = 0
-    converted_fsm = 0
-    converted_ere = 0
-    converted_event = 0
-
-    SUPPORTED = {"ltl", "fsm", "ere", "event"}
+    converted = {f: 0 for f in SUPPORTED}
 
-    all_files = list(MOP_ROOT.rglob("*.mop"))
+    all_files = list(iter_mop_files(MOP_ROOT))
     total_files = len(all_files)
 
-    for mop_file in all_files:
-        text = mop_file.read_text(encoding="utf-8", errors="replace")
-        formalism = detect_formalism(text)
-
-        if formalism not in SUPPORTED:
-            continue
-
-        print(f"Processing {formalism.upper()}:", mop_file)
-
-        try:
-            ir = convert_mop_file_to_ir(mop_file)
+    # Files are independent: convert them in worker processes.
+    workers = os.cpu_count() or 1
+    chunksize = max(1, total_files // (4 * workers))
 
-            relative = mop_file.relative_to(MOP_ROOT)
-            target = OUT_ROOT / relative.with_suffix(".json")
-            target.parent.mkdir(parents=True, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for mop_file, formalism, error in ex.map(_process_one, all_files, chunksize=chunksize):
+            if formalism not in SUPPORTED:
+                continue
 
-            with open(target, "w", encoding="utf-8") as f:
-                json.dump(ir, f, indent=2, ensure_ascii=False)
+            print(f"Processing {formalism.upper()}:", mop_file)
 
-            if formalism == "ltl":
-                converted_ltl += 1
-            elif formalism == "fsm":
-                converted_fsm += 1
-            elif formalism == "ere":
-                converted_ere += 1
-            elif formalism == "event":
-                converted_event += 1
+            if error is not None:
+                print(f"[ERROR] {mop_file}")
+                print(f"        {error}")
+                continue
 
-        except Exception as e:
-            print(f"[ERROR] {mop_file}")
-            print(f"        {e}")
+            converted[formalism] += 1
 
-    total_converted = (
-        converted_ltl
-        + converted_fsm
-        + converted_ere
-        + converted_event
-    )
+    total_converted = sum(converted.values())
 
     print("=" * 70)
     print("[SUMMARY]")
-    print(f"  Converted LTL   : {converted_ltl}")
-    print(f"  Converted FSM   : {converted_fsm}")
-    print(f"  Converted ERE   : {converted_ere}")
-    print(f"  Converted EVENT : {converted_event}")
+    print(f"  Converted LTL   : {converted['ltl']}")
+    print(f"  Converted FSM   : {converted['fsm']}")
+    print(f"  Converted ERE   : {converted['ere']}")
+    print(f"  Converted EVENT : {converted['event']}")
     print("-" * 70)
     print(f"  Total Converted : {total_converted}")
     print(f"  Total Files     : {total_files}")
@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from nl2spec.scripts.convert_ir_to_nl import unique_out_path
+
+
+def _assign(ids, out_dir=Path("nl") / "io"):
+    claimed, next_index = set(), {}
+    return [unique_out_path(out_dir, i, claimed, next_index).name for i in ids]
+
+
+def test_duplicate_ids_get_suffixes():
+    assert _assign(["Foo", "Foo", "Foo"]) == ["Foo.txt", "Foo__2.txt", "Foo__3.txt"]
+
+
+def test_case_variant_ids_do_not_share_a_file():
+    names = _assign(["Foo", "foo", "FOO", "foo"])
+
+    assert names == ["Foo.txt", "foo__2.txt", "FOO__3.txt", "foo__4.txt"]
+    assert len({n.casefold() for n in names}) == len(names)
+
+
+def test_suffix_collides_with_literal_id():
+    names = _assign(["Foo", "Foo__2", "foo"])
+
+    assert names == ["Foo.txt", "Foo__2.txt", "foo__3.txt"]
+
+
+def test_ids_in_other_directories_are_independent():
+    claimed, next_index = set(), {}
+    a = unique_out_path(Path("nl") / "io", "Foo", claimed, next_index)
+    b = unique_out_path(Path("nl") / "util", "foo", claimed, next_index)
+
+    assert (a.name, b.name) == ("Foo.txt", "foo.txt")
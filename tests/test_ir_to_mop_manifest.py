@@ -0,0 +1,132 @@
+import json
+
+import pytest
+
+from nl2spec.scripts import run_generated_ir_to_mop as ir_to_mop
+
+MARK = "untouched since the last run"
+
+
+def _ir(spec_id, ir_type="ere", formula="(next hasNext)*"):
+    return {
+        "id": spec_id,
+        "signature": {"parameters": [{"type": "Iterator", "name": "i"}]},
+        "ir": {
+            "type": ir_type,
+            "events": [{
+                "name": "next",
+                "timing": "before",
+                "parameters": [{"type": "Iterator", "name": "i"}],
+                "pointcut": {"raw": "call(* Iterator.next()) && target(i)"},
+            }],
+            "formula": {"raw": formula},
+        },
+    }
+
+
+def _write_ir(ir_dir, spec_id, **kwargs):
+    (ir_dir / "io" / f"{spec_id}.json").write_text(
+        json.dumps(_ir(spec_id, **kwargs)), encoding="utf-8"
+    )
+
+
+def _mark(out_dir):
+    for mop in out_dir.rglob("*.mop"):
+        mop.write_text(MARK, encoding="utf-8")
+
+
+def _marked(out_dir):
+    return {
+        mop.stem for mop in out_dir.rglob("*.mop")
+        if mop.read_text(encoding="utf-8") == MARK
+    }
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    ir_dir = tmp_path / "ir"
+    out_dir = tmp_path / "mop"
+
+    monkeypatch.setattr(ir_to_mop, "IR_INPUT_DIR", ir_dir)
+    monkeypatch.setattr(ir_to_mop, "MOP_OUTPUT_DIR", out_dir)
+    monkeypatch.setattr(ir_to_mop, "MANIFEST_PATH", out_dir / ".manifest.json")
+    monkeypatch.setattr(ir_to_mop, "ask_overwrite", lambda path: True)
+
+    (ir_dir / "io").mkdir(parents=True)
+    _write_ir(ir_dir, "A")
+    _write_ir(ir_dir, "B")
+
+    ir_to_mop.main([])
+    assert (out_dir / "io" / "A.mop").exists()
+    _mark(out_dir)
+
+    return ir_dir, out_dir
+
+
+def test_unchanged_inputs_are_skipped(tree, capsys):
+    ir_dir, out_dir = tree
+
+    ir_to_mop.main([])
+
+    assert _marked(out_dir) == {"A", "B"}
+    assert "Unchanged (skipped) : 2" in capsys.readouterr().out
+
+
+def test_changed_input_is_regenerated(tree):
+    ir_dir, out_dir = tree
+    _write_ir(ir_dir, "A", formula="(close)*")
+
+    ir_to_mop.main([])
+
+    assert _marked(out_dir) == {"B"}
+    assert "ere : (close)*" in (out_dir / "io" / "A.mop").read_text(encoding="utf-8")
+
+
+def test_changed_ir_type_is_regenerated(tree):
+    ir_dir, out_dir = tree
+    _write_ir(ir_dir, "A", ir_type="ltl")
+
+    ir_to_mop.main([])
+
+    assert _marked(out_dir) == {"B"}
+    assert "ltl : " in (out_dir / "io" / "A.mop").read_text(encoding="utf-8")
+
+
+def test_ir_type_without_reconstructor_drops_output(tree):
+    ir_dir, out_dir = tree
+    _write_ir(ir_dir, "A", ir_type="other")
+
+    ir_to_mop.main([])
+
+    assert not (out_dir / "io" / "A.mop").exists()
+    assert _marked(out_dir) == {"B"}
+
+
+def test_deleted_output_is_regenerated(tree):
+    ir_dir, out_dir = tree
+    (out_dir / "io" / "A.mop").unlink()
+
+    ir_to_mop.main([])
+
+    assert (out_dir / "io" / "A.mop").read_text(encoding="utf-8") != MARK
+    assert _marked(out_dir) == {"B"}
+
+
+def test_deleted_input_removes_output(tree):
+    ir_dir, out_dir = tree
+    (ir_dir / "io" / "A.json").unlink()
+
+    ir_to_mop.main([])
+
+    assert not (out_dir / "io" / "A.mop").exists()
+    assert _marked(out_dir) == {"B"}
+
+
+def test_rebuild_ignores_manifest(tree, capsys):
+    ir_dir, out_dir = tree
+
+    ir_to_mop.main(["--rebuild"])
+
+    assert _marked(out_dir) == set()
+    assert (out_dir / "io" / "A.mop").exists()
+    assert "Unchanged (skipped) : 0" in capsys.readouterr().out
@@ -0,0 +1,99 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from nl2spec.core.handlers.fewshot_loader import FewShotLoader
+from nl2spec.core.handlers.irsp_matrix import IRSPFeatureMatrix
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE_IR = ROOT / "datasets" / "baseline_ir"
+
+
+def _build_pool(root: Path, formalism: str, duplicates: int = 3) -> list:
+    """
+    Copy the baseline IRs of one formalism into root/<formalism>. The first
+    few files are copied twice, so equal distances (ties) are exercised.
+    """
+    target = root / formalism
+    target.mkdir(parents=True)
+
+    sources = [
+        p for p in sorted(BASELINE_IR.rglob("*.json"))
+        if (json.loads(p.read_text(encoding="utf-8")).get("formalism") or "").lower() == formalism
+    ]
+    for p in sources:
+        shutil.copy(p, target / p.name)
+    for p in sources[:duplicates]:
+        shutil.copy(p, target / f"zz_copy_{p.name}")
+
+    return sorted(target.glob("*.json"), key=lambda p: p.name)
+
+
+def _expected(loader, formalism, files, k, ir_base):
+    return loader._get_selector(formalism).select(files, k, ir_base, return_scores=True)
+
+
+def _corrupt_truncated_meta(cache_dir, formalism):
+    meta = cache_dir / f"irsp_{formalism}.json"
+    meta.write_text(meta.read_text(encoding="utf-8")[:10], encoding="utf-8")
+
+
+def _corrupt_npy(cache_dir, formalism):
+    (cache_dir / f"irsp_{formalism}.npy").write_bytes(b"\x93NUMPY garbage")
+
+
+def _corrupt_stale_names(cache_dir, formalism):
+    meta_path = cache_dir / f"irsp_{formalism}.json"
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    meta["paths"][0] = "missing.json"
+    meta_path.write_text(json.dumps(meta), encoding="utf-8")
+
+
+def _corrupt_not_a_dict(cache_dir, formalism):
+    (cache_dir / f"irsp_{formalism}.json").write_text("[]", encoding="utf-8")
+
+
+@pytest.mark.parametrize("corrupt", [
+    _corrupt_truncated_meta,
+    _corrupt_npy,
+    _corrupt_stale_names,
+    _corrupt_not_a_dict,
+])
+def test_corrupt_cache_is_rebuilt(tmp_path, corrupt):
+    files = _build_pool(tmp_path, "fsm")
+    ir_base = json.loads(files[0].read_text(encoding="utf-8"))
+
+    loader = FewShotLoader(str(tmp_path))
+    first = loader.get("fsm", "few", 3, "irsp", ir_base=ir_base, return_scores=True)
+    assert first == _expected(loader, "fsm", files, 3, ir_base)
+
+    corrupt(tmp_path / ".cache", "fsm")
+
+    loader = FewShotLoader(str(tmp_path))
+    again = loader.get("fsm", "few", 3, "irsp", ir_base=ir_base, return_scores=True)
+    assert again == _expected(loader, "fsm", files, 3, ir_base)
+
+    # the rewritten cache is valid again
+    loader = FewShotLoader(str(tmp_path))
+    assert loader.get("fsm", "few", 3, "irsp", ir_base=ir_base, return_scores=True) == again
+
+
+@pytest.mark.parametrize("formalism", ["fsm", "ere", "ltl", "event"])
+@pytest.mark.parametrize("k", [1, 3, 1000])
+def test_matrix_select_matches_selector(tmp_path, formalism, k):
+    files = _build_pool(tmp_path, formalism)
+    selector = FewShotLoader(str(tmp_path))._get_selector(formalism)
+    mat = IRSPFeatureMatrix.build(selector, formalism, files)
+
+    # the zz_copy_ files tie at distance 0 with their originals
+    tied = [p for p in files if p.name.startswith("zz_copy_")]
+    queries = [json.loads(p.read_text(encoding="utf-8")) for p in tied + files[:10]]
+    queries.append({"formalism": formalism, "ir": {}})
+
+    for ir_base in queries:
+        assert mat.select(k, ir_base, return_scores=True) == selector.select(
+            files, k, ir_base, return_scores=True
+        )
+        assert mat.select(k, ir_base) == selector.select(files, k, ir_base)
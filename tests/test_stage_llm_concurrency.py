@@ -0,0 +1,85 @@
+import csv
+import importlib
+import sys
+import types
+
+import pytest
+
+from nl2spec.core.llms import mock_llm
+from nl2spec.core.llms.mock_llm import MockLLM
+
+
+class TupleMockLLM(MockLLM):
+    """MockLLM returning (text, usage) like the real adapters."""
+
+    def generate(self, prompt: str):
+        if "FAIL" in prompt:
+            raise RuntimeError("mock failure")
+        return super().generate(prompt), None
+
+
+@pytest.fixture
+def stage_llm(monkeypatch):
+    # llm_factory loads the provider registry (API keys) at import time
+    monkeypatch.setitem(
+        sys.modules,
+        "nl2spec.core.llms.factory.llm_factory",
+        types.SimpleNamespace(create_llm=None),
+    )
+    monkeypatch.delitem(sys.modules, "nl2spec.pipeline.stage_llm", raising=False)
+    module = importlib.import_module("nl2spec.pipeline.stage_llm")
+
+    monkeypatch.setattr(module, "create_llm", lambda cfg: TupleMockLLM())
+    monkeypatch.setattr(mock_llm.random, "choice", lambda seq: seq[0])
+    yield module
+
+    # drop the copy bound to the stub factory
+    sys.modules.pop("nl2spec.pipeline.stage_llm", None)
+
+
+def _run(stage_llm, monkeypatch, base, concurrency):
+    prompts = base / "prompt" / "random" / "few" / "ere"
+    prompts.mkdir(parents=True)
+    for i, domain in enumerate(["io", "util", "net", "lang", "io", "util"]):
+        (prompts / f"Spec_{i}.txt").write_text(
+            f'ere example "domain": "{domain}"', encoding="utf-8"
+        )
+    (prompts / "Spec_fail.txt").write_text('FAIL "domain": "io"', encoding="utf-8")
+
+    monkeypatch.setattr(stage_llm, "BASE_OUTPUT", base)
+
+    cfg = {
+        "llm": {"provider": "mock", "concurrency": concurrency},
+        "prompting": {"shot_mode": "few", "k": 3, "fewshot": {"selection": "random"}},
+    }
+    stage_llm.stage_llm(types.SimpleNamespace(config=cfg), flags=None)
+
+
+def _outputs(base):
+    root = base / "llm" / "mock"
+    return {
+        str(p.relative_to(root)): p.read_text(encoding="utf-8")
+        for p in root.rglob("*") if p.is_file()
+    }
+
+
+def _rows(path, drop):
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = list(csv.reader(f))
+    return rows[0], sorted(row[:drop] for row in rows[1:])
+
+
+def test_concurrent_run_matches_sequential(stage_llm, monkeypatch, tmp_path):
+    seq, conc = tmp_path / "seq", tmp_path / "conc"
+    _run(stage_llm, monkeypatch, seq, concurrency=1)
+    _run(stage_llm, monkeypatch, conc, concurrency=4)
+
+    assert _outputs(seq) == _outputs(conc)
+    assert len(_outputs(seq)) == 6
+
+    # elapsed_ms is the last token column; start/end/elapsed the last stats ones
+    token_csv = "llm/token/token/information_response_token.csv"
+    assert _rows(seq / token_csv, -1) == _rows(conc / token_csv, -1)
+
+    stats_csv = "statistics/generation_times_random_mock_mock-model_few.csv"
+    assert _rows(seq / stats_csv, -3) == _rows(conc / stats_csv, -3)
@@ -0,0 +1,53 @@
+import copy
+import json
+from operator import attrgetter
+from pathlib import Path
+
+import pytest
+from jsonschema import Draft202012Validator
+
+from nl2spec.core.inspection.validate_ir import IRValidator
+
+ROOT = Path(__file__).resolve().parents[1]
+SCHEMA = ROOT / "core" / "schemas" / "ir.schema.json"
+DATA = Path(__file__).resolve().parent / "data"
+
+
+def _reference(ir):
+    """Verdict and errors straight from jsonschema, as before the fast path."""
+    validator = Draft202012Validator(json.loads(SCHEMA.read_text(encoding="utf-8")))
+    errors = sorted(validator.iter_errors(ir), key=attrgetter("path"))
+    return not errors, [IRValidator._format_error(e) for e in errors]
+
+
+def _cases():
+    valid = json.loads((DATA / "valid" / "event_valid.json").read_text(encoding="utf-8"))
+
+    cases = [
+        json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted(DATA.rglob("*.json"))
+    ]
+    cases += [
+        json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted((ROOT / "datasets" / "baseline_ir").rglob("*.json"))[:20]
+    ]
+
+    bad_timing = copy.deepcopy(valid)
+    bad_timing["ir"]["events"][0]["timing"] = "during"
+    no_events = copy.deepcopy(valid)
+    no_events["ir"]["events"] = []
+    wrong_type = copy.deepcopy(valid)
+    wrong_type["ir"]["type"] = 3
+
+    return cases + [bad_timing, no_events, wrong_type, {}, []]
+
+
+@pytest.mark.parametrize("ir", _cases())
+def test_validate_dict_matches_jsonschema(ir):
+    result = IRValidator(str(SCHEMA)).validate_dict(ir)
+
+    assert (result.valid, result.errors) == _reference(ir)
+
+
+def test_schema_compiled_once():
+    assert IRValidator(str(SCHEMA)).validator is IRValidator(str(SCHEMA)).validator